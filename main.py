@@ -16,7 +16,7 @@ from pathlib import Path
 
 from src.claimer import EpicGamesClaimer
 from src.config import Config
-from src.logger import Logger
+from src.logger import get_logger
 from src.scheduler import Scheduler
 
 
@@ -102,7 +102,7 @@ def main() -> int:
         config.schedule_minute = args.minute
 
     # Initialize logger
-    logger = Logger(str(config.log_base_dir))
+    logger = get_logger(str(config.log_base_dir))
 
     try:
         if args.status:
@@ -23,6 +23,8 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.utils import atomic_write_bytes, json_dumps
+
 
 def extract_from_chrome() -> bool:
     """
@@ -83,8 +85,7 @@ def extract_from_chrome() -> bool:
         output_dir.mkdir(parents=True, exist_ok=True)
         session_file = output_dir / "session.json"
         
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+        atomic_write_bytes(session_file, json_dumps(session.to_dict(), indent=True))
         
         print("✅ Sessão extraída com sucesso!")
         print(f"   👤 Conta:       {session.display_name}")
@@ -104,7 +105,7 @@ def extract_from_chrome() -> bool:
         
     except ImportError as e:
         print(f"❌ Dependências não instaladas: {e}")
-        print("\n   Execute: pip install pywin32 cryptography")
+        print("\n   Execute: pip install cryptography")
         return False
     except Exception as e:
         print(f"❌ Erro na extração: {e}")
@@ -192,8 +193,7 @@ def create_session_from_token(eg1_token: str, output_dir: Optional[Path] = None)
         output_dir.mkdir(parents=True, exist_ok=True)
         session_file = output_dir / "session.json"
         
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session, f, indent=2, ensure_ascii=False)
+        atomic_write_bytes(session_file, json_dumps(session, indent=True))
         
         print("\n✅ Sessão criada com sucesso!")
         print(f"   👤 Conta:       {display_name}")
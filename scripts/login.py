@@ -17,6 +17,8 @@ from datetime import datetime, timezone
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.utils import atomic_write_bytes, json_dumps
+
 
 def interactive_login():
     """
@@ -112,8 +114,7 @@ Instruções:
                 output_dir.mkdir(parents=True, exist_ok=True)
                 session_file = output_dir / "session.json"
                 
-                with open(session_file, 'w', encoding='utf-8') as f:
-                    json.dump(session_data, f, indent=2, ensure_ascii=False)
+                atomic_write_bytes(session_file, json_dumps(session_data, indent=True))
                 
                 print(f"\n✅ Sessão salva com sucesso!")
                 print(f"   👤 Conta: {session_data.get('display_name', 'N/A')}")
@@ -3,7 +3,7 @@
 from .api import EpicAPI
 from .claimer import EpicGamesClaimer
 from .config import Config
-from .logger import Logger
+from .logger import Logger, get_logger
 from .session_store import Session, SessionStore
 
 
@@ -14,4 +14,5 @@ __all__ = [
     "Logger",
     "Session",
     "SessionStore",
+    "get_logger",
 ]
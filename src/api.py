@@ -10,7 +10,11 @@ HTTP client for Epic Games services:
 
 import base64
 import contextlib
+import hashlib
+import logging
+import random
 import time
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -29,6 +33,7 @@ from .models import (
     SUCCESS_PATTERNS,
     ClaimStatus,
 )
+from .utils import parse_datetime
 
 
 class EpicAPI:
@@ -41,21 +46,38 @@ class EpicAPI:
     FREE_GAMES_API = "https://store-site-backend-static-ipv4.ak.epicgames.com/freeGamesPromotions"
     EXTERNAL_FREE_GAMES_API = "https://freegamesepic.onrender.com/api/games"
 
-    def __init__(self, config: Config, logger: Logger):
+    # Reuse a successful verify_token result for this many seconds
+    VERIFY_CACHE_TTL = 1800
+
+    def __init__(
+        self, config: Config, logger: Logger, http_client: requests.Session | None = None
+    ):
         """
         Initialize API client.
 
         Args:
             config: Application configuration.
             logger: Logger instance.
+            http_client: Shared HTTP session (keep-alive pool) to use for all
+                requests.  A private one is created if None.
         """
         self.config = config
         self._logger = logger
-        self.session = requests.Session()
+        self.session = http_client or requests.Session()
+        self._owns_session = http_client is None
         self._setup_session()
+        # Last freeGamesPromotions ETag and body, for If-None-Match
+        self._promotions_etag = ""
+        self._promotions_data: dict[str, Any] | None = None
+        # sha256(access token) -> (monotonic expiry, verify response)
+        self._verify_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
 
     def _setup_session(self) -> None:
-        """Configure default request headers."""
+        """Configure connection pooling and default request headers."""
+        # Keep-alive pools sized for the concurrent discovery fetches; one
+        # pool per host (OAuth, store, entitlements, ...)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount("https://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": self.config.user_agent,
@@ -67,6 +89,11 @@ class EpicAPI:
             }
         )
 
+    def close(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_session:
+            self.session.close()
+
     def _basic_auth(self) -> str:
         """Generate Basic auth header from client credentials."""
         if not self.config.client_secret:
@@ -140,22 +167,38 @@ class EpicAPI:
             return None
 
     def poll_device_auth(
-        self, device_code: str, interval: int = 5, max_attempts: int = 60
+        self,
+        device_code: str,
+        interval: float = 5,
+        expires_in: float = 600,
+        max_interval: float = 10,
     ) -> dict[str, Any] | None:
         """
         Poll for device authorization completion.
 
+        Starts at the server-provided interval and backs off by 1.5x (with
+        a little jitter) while authorization is pending, up to
+        ``max_interval``; ``slow_down`` doubles the delay.  Polling stops
+        at a monotonic deadline just before the device code expires.
+
         Args:
             device_code: The device code from start_device_auth.
-            interval: Polling interval in seconds.
-            max_attempts: Maximum polling attempts.
+            interval: Server-provided polling interval in seconds (minimum).
+            expires_in: Device code lifetime in seconds.
+            max_interval: Upper bound for the backed-off interval.
 
         Returns:
             Token response or None if failed/expired.
         """
         url = f"{self.OAUTH_HOST}/account/api/oauth/token"
-
-        for attempt in range(1, max_attempts + 1):
+        # Small safety buffer so the last poll doesn't race expiry
+        deadline = time.monotonic() + expires_in - 2
+        current = float(interval)
+        max_interval = max(max_interval, current)
+        attempt = 0
+
+        while True:
+            attempt += 1
             try:
                 response = self.session.post(
                     url,
@@ -174,15 +217,15 @@ class EpicAPI:
 
                 if "authorization_pending" in error_code:
                     self._logger.debug(
-                        "Waiting for authorization...", attempt=f"{attempt}/{max_attempts}"
+                        "Waiting for authorization...", attempt=attempt, interval=f"{current:.1f}s"
                     )
-                    time.sleep(interval)
-                    continue
+                    delay = current
+                    current = min(max_interval, current * 1.5)
 
                 elif "slow_down" in error_code:
                     self._logger.debug("Rate limited, slowing down")
-                    time.sleep(interval * 2)
-                    continue
+                    current = min(max_interval * 2, current * 2)
+                    delay = current
 
                 elif "expired" in error_code:
                     self._logger.error("Device code expired")
@@ -198,9 +241,16 @@ class EpicAPI:
 
             except requests.RequestException as e:
                 self._logger.error("Polling error", exc=e, attempt=attempt)
-                time.sleep(interval)
+                delay = current
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Never poll faster than the server interval
+            delay = max(float(interval), delay + random.uniform(-0.2, 0.2))
+            time.sleep(min(delay, remaining))
 
-        self._logger.error("Max polling attempts reached")
+        self._logger.error("Device code expired before authorization")
         return None
 
     def refresh_token(self, refresh_token: str) -> dict[str, Any] | None:
@@ -243,12 +293,23 @@ class EpicAPI:
         """
         Verify access token and get account info.
 
+        Successful results are cached per token for up to
+        ``VERIFY_CACHE_TTL`` seconds (never past the token's own expiry).
+
         Args:
             access_token: Token to verify.
 
         Returns:
             Account info if valid, None otherwise.
         """
+        key = hashlib.sha256(access_token.encode()).digest()
+        now = time.monotonic()
+        cached = self._verify_cache.get(key)
+        if cached:
+            if now < cached[0]:
+                return cached[1]
+            del self._verify_cache[key]
+
         url = f"{self.OAUTH_HOST}/account/api/oauth/verify"
 
         try:
@@ -267,12 +328,19 @@ class EpicAPI:
                     account=data.get("displayName"),
                     account_id=data.get("account_id", "")[:8] + "...",
                 )
+                ttl = min(self.VERIFY_CACHE_TTL, data.get("expires_in", self.VERIFY_CACHE_TTL))
+                if ttl > 0:
+                    if len(self._verify_cache) >= 64:
+                        self._verify_cache = {
+                            k: v for k, v in self._verify_cache.items() if now < v[0]
+                        }
+                    self._verify_cache[key] = (now + ttl, data)
                 return data
 
             return None
 
         except requests.RequestException as e:
-            self._logger.debug(f"Token verification failed: {e}")
+            self._logger.debug("Token verification failed: %s", e)
             return None
 
     # =========================================================================
@@ -330,20 +398,31 @@ class EpicAPI:
             "allowCountries": self.config.country,
         }
 
+        headers = {}
+        if self._promotions_etag and self._promotions_data is not None:
+            headers["If-None-Match"] = self._promotions_etag
+
         try:
             response = self.session.get(
                 self.FREE_GAMES_API,
                 params=params,
+                headers=headers,
                 timeout=self.config.timeout,
             )
 
             self._logger.network("GET", self.FREE_GAMES_API, status=response.status_code)
 
+            if response.status_code == 304 and self._promotions_data is not None:
+                # Unchanged; re-parse since "currently active" depends on now
+                return self._parse_promotions_response(self._promotions_data)
+
             if response.status_code != 200:
                 self._logger.warning(f"Free Games API returned {response.status_code}")
                 return []
 
             data = response.json()
+            self._promotions_etag = response.headers.get("ETag", "")
+            self._promotions_data = data
             return self._parse_promotions_response(data)
 
         except requests.RequestException as e:
@@ -372,7 +451,7 @@ class EpicAPI:
                 data.get("data", {}).get("Catalog", {}).get("searchStore", {}).get("elements", [])
             )
 
-            self._logger.debug(f"Found {len(elements)} elements in promotions response")
+            self._logger.debug("Found %s elements in promotions response", len(elements))
 
             for game in elements:
                 promotions = game.get("promotions")
@@ -387,12 +466,8 @@ class EpicAPI:
 
                         if discount == 0:  # 0% = 100% discount = FREE
                             try:
-                                start = datetime.fromisoformat(
-                                    offer["startDate"].replace("Z", "+00:00")
-                                )
-                                end = datetime.fromisoformat(
-                                    offer["endDate"].replace("Z", "+00:00")
-                                )
+                                start = parse_datetime(offer["startDate"])
+                                end = parse_datetime(offer["endDate"])
 
                                 if start <= now <= end:
                                     # Get the best slug for the game
@@ -412,7 +487,7 @@ class EpicAPI:
                                         namespace=game["namespace"][:12] + "...",
                                     )
                             except (KeyError, ValueError) as e:
-                                self._logger.debug(f"Error parsing offer dates: {e}")
+                                self._logger.debug("Error parsing offer dates: %s", e)
 
             self._logger.success(f"Found {len(free_games)} free games")
             return free_games
@@ -468,7 +543,7 @@ class EpicAPI:
 
         try:
             # Use reliable external API with proper validation
-            response = requests.get(
+            response = self.session.get(
                 self.EXTERNAL_FREE_GAMES_API,
                 timeout=self.config.timeout,
                 verify=True,
@@ -565,7 +640,7 @@ class EpicAPI:
                 if ns:
                     result["namespaces"].add(ns)
 
-            self._logger.debug(f"Found {len(result['ids'])} owned items")
+            self._logger.debug("Found %s owned items", len(result["ids"]))
             return result
 
         except requests.RequestException as e:
@@ -596,35 +671,58 @@ class EpicAPI:
         Returns:
             ClaimStatus value string.
         """
-        self._logger.game("Attempting to claim", title, offer_id=offer_id[:8] + "...")
+        game = {"id": offer_id, "namespace": namespace, "title": title, "slug": slug}
+        results = self.claim_games_batch(access_token, account_id, [game])
+        return results.get(offer_id, ClaimStatus.FAILED)
 
-        status = self._claim_via_playwright(namespace, offer_id, access_token, title, slug)
+    def _verify_claims(
+        self, access_token: str, account_id: str, claimed: dict[str, tuple[str, str]]
+    ) -> dict[str, str]:
+        """
+        Confirm reported claims by polling the entitlements API.
 
-        if status == ClaimStatus.CLAIMED:
-            try:
-                self._logger.info("Verifying claim via entitlements...")
-                for attempt in range(1, 11):
-                    owned = self.get_owned_games(access_token, account_id)
-                    if namespace in owned["namespaces"]:
-                        self._logger.success(f"Claim verified: {title}")
-                        return ClaimStatus.CLAIMED
-                    time.sleep(3)
-                    if attempt in {3, 6, 9}:
-                        self._logger.info(
-                            "Still waiting for entitlement propagation...",
-                            attempt=f"{attempt}/10",
-                        )
+        Every pending claim is checked against a single entitlements fetch
+        per round, so verifying a batch costs the same as verifying one
+        game.
 
+        Args:
+            access_token: Valid access token.
+            account_id: Account ID.
+            claimed: Offer ID -> (namespace, title) for claims the browser
+                flow reported as successful.
+
+        Returns:
+            Offer ID -> ClaimStatus.CLAIMED if the namespace shows up,
+            else ClaimStatus.FAILED.
+        """
+        results = dict.fromkeys(claimed, ClaimStatus.FAILED)
+        pending = dict(claimed)
+        try:
+            self._logger.info("Verifying %s claim(s) via entitlements...", len(pending))
+            for attempt in range(1, 11):
+                owned_ns = self.get_owned_games(access_token, account_id)["namespaces"]
+                for offer_id, (namespace, title) in list(pending.items()):
+                    if namespace in owned_ns:
+                        self._logger.success("Claim verified: %s", title)
+                        results[offer_id] = ClaimStatus.CLAIMED
+                        del pending[offer_id]
+                if not pending:
+                    break
+                time.sleep(3)
+                if attempt in {3, 6, 9}:
+                    self._logger.info(
+                        "Still waiting for entitlement propagation...",
+                        attempt=f"{attempt}/10",
+                    )
+
+            for _namespace, title in pending.values():
                 self._logger.error(
                     "Claim flow completed but entitlement NOT found.",
                     title=title,
                 )
-                return ClaimStatus.FAILED
-            except Exception as e:
-                self._logger.error("Claim verification failed", exc=e)
-                return ClaimStatus.FAILED
-
-        return status
+        except Exception as e:
+            self._logger.error("Claim verification failed", exc=e)
+        return results
 
     # =========================================================================
     # Browser-based claim helpers
@@ -921,11 +1019,150 @@ class EpicAPI:
         with contextlib.suppress(Exception):
             page.screenshot(path=os.path.join(debug_dir, f"{name}.png"))
 
-    def _claim_via_playwright(
+    def claim_games_batch(
+        self,
+        access_token: str | Callable[[], str],
+        account_id: str,
+        games: list[dict[str, Any]],
+        pace: Callable[[], None] | None = None,
+    ) -> dict[str, str]:
+        """
+        Claim several free games in one browser session.
+
+        The browser is launched, authenticated and pointed at the store
+        once; each game then only costs its own product page flow.
+        Successful claims are verified together via the entitlements API
+        once the browser is closed.  The batch stops at the first
+        rate-limit response.
+
+        Args:
+            access_token: Valid access token, or a callable returning the
+                current one (so a token refreshed during a long, paced batch
+                is picked up).
+            account_id: Account ID (for entitlement verification).
+            games: Game dicts with ``id``, ``namespace``, ``title``, ``slug``.
+            pace: Optional callable run before each claim (rate pacing).
+
+        Returns:
+            Mapping of offer ID to ClaimStatus value for each processed
+            game; games skipped after a rate limit are absent.
+        """
+        results: dict[str, str] = {}
+        if not games:
+            return results
+
+        if callable(access_token):
+            get_token = access_token
+        else:
+
+            def get_token() -> str:
+                return access_token
+
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError as e:
+            self._logger.error("Playwright not installed: %s", e)
+            return dict.fromkeys((g["id"] for g in games), ClaimStatus.FAILED)
+
+        browser_mgr = BrowserManager(self.config, self._logger)
+        # Offer ID -> (namespace, title) for claims awaiting verification
+        claimed: dict[str, tuple[str, str]] = {}
+
+        try:
+            with sync_playwright() as p:
+                page = self._open_store_session(p, browser_mgr, get_token())
+                if page is None:
+                    return dict.fromkeys((g["id"] for g in games), ClaimStatus.FAILED)
+
+                for game in games:
+                    if pace:
+                        pace()
+
+                    offer_id = game["id"]
+                    namespace = game["namespace"]
+                    title = game.get("title", "Unknown")
+                    self._logger.game(
+                        "Attempting to claim", title, offer_id=offer_id[:8] + "..."
+                    )
+
+                    try:
+                        status = self._claim_on_page(
+                            page, namespace, offer_id, title, game.get("slug", "")
+                        )
+                    except Exception as e:
+                        self._logger.error("Browser claim error: %s", e)
+                        status = ClaimStatus.FAILED
+
+                    if status == ClaimStatus.CLAIMED:
+                        claimed[offer_id] = (namespace, title)
+
+                    results[offer_id] = status
+                    if status == ClaimStatus.RATE_LIMITED:
+                        break
+
+        except Exception as e:
+            self._logger.error("Browser claim error: %s", e)
+            for game in games:
+                results.setdefault(game["id"], ClaimStatus.FAILED)
+        finally:
+            browser_mgr.close()
+
+        # Verify after the browser is gone; entitlements for earlier games
+        # have been propagating while later ones were claimed
+        if claimed:
+            results.update(self._verify_claims(get_token(), account_id, claimed))
+
+        return results
+
+    def _open_store_session(
+        self, playwright: Any, browser_mgr: BrowserManager, access_token: str
+    ) -> Any:
+        """
+        Launch the browser and establish an authenticated store session.
+
+        Returns:
+            A Playwright Page, or None if login could not be completed.
+        """
+        page = browser_mgr.get_page(
+            playwright,
+            access_token=access_token,
+            headless=False,
+        )
+
+        # Navigate to store root first — establishes cookie domain
+        # and activates the injected EPIC_EG1 session cookie.
+        self._logger.info("Navigating to Epic Store to establish session...")
+        page.goto(
+            "https://store.epicgames.com/",
+            wait_until="load",
+            timeout=60000,
+        )
+        page.wait_for_timeout(3000)
+
+        # Verify login succeeded (look for account menu indicator)
+        store_url = page.url
+        if "login" in store_url.lower() or "id/login" in store_url.lower():
+            self._logger.warning(
+                "Store redirected to login — waiting for manual login..."
+            )
+            # Wait up to 120s for user to log in manually
+            for _wait in range(40):
+                page.wait_for_timeout(3000)
+                if "login" not in page.url.lower():
+                    self._logger.info("Login completed!")
+                    page.wait_for_timeout(2000)
+                    break
+            else:
+                self._logger.error("Login timeout — aborting")
+                return None
+
+        return page
+
+    def _claim_on_page(
         self,
+        page: Any,
         namespace: str,
         offer_id: str,
-        access_token: str,
         title: str,
         slug: str = "",
     ) -> str:
@@ -941,15 +1178,12 @@ class EpicAPI:
            then fallback re-click if needed.
         6. Inspect the page to determine result.
 
+        Args:
+            page: Page with an authenticated store session.
+
         Returns:
             A ClaimStatus value string.
         """
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError as e:
-            self._logger.error(f"Playwright not installed: {e}")
-            return ClaimStatus.FAILED
-
         # Build the product URL
         locale = self.config.locale.replace("_", "-")  # pt_BR -> pt-BR
         if slug:
@@ -961,310 +1195,263 @@ class EpicAPI:
             )
             self._logger.info(f"Opening purchase page: {product_url}")
 
-        browser_mgr = BrowserManager(self.config, self._logger)
+        # Navigate to the product/purchase page
+        self._logger.info(f"Navigating to: {product_url}")
+        page.goto(product_url, wait_until="load", timeout=60000)
+        page.wait_for_timeout(5000)
 
-        try:
-            with sync_playwright() as p:
-                page = browser_mgr.get_page(
-                    p,
-                    access_token=access_token,
-                    headless=False,
-                )
+        current_url = page.url
+        self._logger.info(f"Current URL: {current_url}")
 
-                # Navigate to store root first — establishes cookie domain
-                # and activates the injected EPIC_EG1 session cookie.
-                self._logger.info("Navigating to Epic Store to establish session...")
-                page.goto(
-                    "https://store.epicgames.com/",
-                    wait_until="load",
-                    timeout=60000,
-                )
-                page.wait_for_timeout(3000)
-
-                # Verify login succeeded (look for account menu indicator)
-                store_url = page.url
-                if "login" in store_url.lower() or "id/login" in store_url.lower():
-                    self._logger.warning(
-                        "Store redirected to login — waiting for manual login..."
-                    )
-                    # Wait up to 120s for user to log in manually
-                    for _wait in range(40):
-                        page.wait_for_timeout(3000)
-                        if "login" not in page.url.lower():
-                            self._logger.info("Login completed!")
-                            page.wait_for_timeout(2000)
-                            break
-                    else:
-                        self._logger.error("Login timeout — aborting")
-                        return ClaimStatus.FAILED
-
-                # Navigate to the product/purchase page
-                self._logger.info(f"Navigating to: {product_url}")
-                page.goto(product_url, wait_until="load", timeout=60000)
-                page.wait_for_timeout(5000)
-
-                current_url = page.url
-                self._logger.info(f"Current URL: {current_url}")
-
-                # Login redirect check
-                if "login" in current_url.lower():
-                    self._logger.warning("Redirected to login -- session invalid")
-                    return ClaimStatus.FAILED
+        # Login redirect check
+        if "login" in current_url.lower():
+            self._logger.warning("Redirected to login -- session invalid")
+            return ClaimStatus.FAILED
 
-                # Read page text once
-                visible_text = self._get_page_text(page)
+        # Read page text once
+        visible_text = self._get_page_text(page)
 
-                if "invalid_offers_code_redemption_only" in visible_text:
-                    self._logger.error("Offer is code-redemption only", title=title)
-                    return ClaimStatus.FAILED
+        if "invalid_offers_code_redemption_only" in visible_text:
+            self._logger.error("Offer is code-redemption only", title=title)
+            return ClaimStatus.FAILED
 
-                if any(pat in visible_text for pat in ALREADY_OWNED_PATTERNS):
-                    self._logger.info(f"Already owned: {title}")
-                    return ClaimStatus.ALREADY_OWNED
+        if any(pat in visible_text for pat in ALREADY_OWNED_PATTERNS):
+            self._logger.info(f"Already owned: {title}")
+            return ClaimStatus.ALREADY_OWNED
 
-                # Handle age gate if present (mature content games)
-                self._handle_age_gate(page)
+        # Handle age gate if present (mature content games)
+        self._handle_age_gate(page)
 
-                # --- Step 1: Find and click the "Get" / "Obter" button ---
-                order_button = self._find_button(page, CLAIM_BUTTON_SELECTORS)
+        # --- Step 1: Find and click the "Get" / "Obter" button ---
+        order_button = self._find_button(page, CLAIM_BUTTON_SELECTORS)
 
-                if not order_button:
-                    self._logger.error("Claim/Get button not found")
-                    self._save_debug_artifact(page, "no_button")
-                    return ClaimStatus.FAILED
+        if not order_button:
+            self._logger.error("Claim/Get button not found")
+            self._save_debug_artifact(page, "no_button")
+            return ClaimStatus.FAILED
 
-                self._logger.info("Found claim button -- clicking...")
-                with contextlib.suppress(Exception):
-                    order_button.scroll_into_view_if_needed()
+        self._logger.info("Found claim button -- clicking...")
+        with contextlib.suppress(Exception):
+            order_button.scroll_into_view_if_needed()
 
-                page.wait_for_timeout(2000)
+        page.wait_for_timeout(2000)
 
-                # Try normal click first (preserves event handlers),
-                # then force click if that fails
+        # Try normal click first (preserves event handlers),
+        # then force click if that fails
+        try:
+            order_button.click(timeout=10000)
+        except Exception:
+            try:
+                order_button.click(force=True, timeout=10000)
+            except Exception:
                 try:
-                    order_button.click(timeout=10000)
+                    order_button.evaluate("el => el.click()")
                 except Exception:
                     try:
-                        order_button.click(force=True, timeout=10000)
+                        order_button.dispatch_event("click")
                     except Exception:
-                        try:
-                            order_button.evaluate("el => el.click()")
-                        except Exception:
-                            try:
-                                order_button.dispatch_event("click")
-                            except Exception:
-                                self._logger.error("All click strategies failed")
-                                return ClaimStatus.FAILED
+                        self._logger.error("All click strategies failed")
+                        return ClaimStatus.FAILED
 
-                self._logger.info("Waiting for checkout step...")
-                page.wait_for_timeout(3000)
+        self._logger.info("Waiting for checkout step...")
+        page.wait_for_timeout(3000)
+
+        # --- Step 2: Checkout / confirm order ---
+        # The checkout overlay can take several seconds to load,
+        # especially on real Chrome.  Retry several times.
+        # For 18+ games, an age-gate popup may appear after clicking
+        # "Obter" — handle it here too.
+        checkout_button = None
+        original_url = page.url  # to detect navigation
+        for retry in range(10):
+            # Handle age gate that may appear AFTER clicking "Obter"
+            # (common for 18+ rated games)
+            self._handle_age_gate(page)
+
+            checkout_button = self._find_button(
+                page, CHECKOUT_SELECTORS, timeout=3000
+            )
+            if checkout_button:
+                break
 
-                # --- Step 2: Checkout / confirm order ---
-                # The checkout overlay can take several seconds to load,
-                # especially on real Chrome.  Retry several times.
-                # For 18+ games, an age-gate popup may appear after clicking
-                # "Obter" — handle it here too.
-                checkout_button = None
-                original_url = page.url  # to detect navigation
-                for retry in range(10):
-                    # Handle age gate that may appear AFTER clicking "Obter"
-                    # (common for 18+ rated games)
-                    self._handle_age_gate(page)
-
-                    checkout_button = self._find_button(
-                        page, CHECKOUT_SELECTORS, timeout=3000
-                    )
-                    if checkout_button:
+            # Check for strong success/already-owned signals only
+            # (no optimistic fallback — checkout may still be loading)
+            text = self._get_page_text(page)
+            url = page.url
+
+            if any(pat in text for pat in ALREADY_OWNED_PATTERNS):
+                self._logger.info(f"Already owned: {title}")
+                return ClaimStatus.ALREADY_OWNED
+
+            # Only trust success patterns if URL changed from
+            # product page (avoids matching game descriptions
+            # or localization strings embedded in page text)
+            url_changed = url != original_url
+            purchase_url = any(
+                kw in url
+                for kw in ("receipt", "confirmation", "purchase/success")
+            )
+            if purchase_url or (
+                url_changed and any(pat in text for pat in SUCCESS_PATTERNS)
+            ):
+                self._logger.info(
+                    "Order completed automatically (no checkout needed)"
+                )
+                return ClaimStatus.CLAIMED
+
+            # Detect login redirect after clicking claim
+            if "login" in url.lower() or "id/login" in url.lower():
+                self._logger.warning(
+                    "Redirected to login after click — waiting for login..."
+                )
+                for _w in range(40):
+                    page.wait_for_timeout(3000)
+                    if "login" not in page.url.lower():
+                        self._logger.info("Login completed — retrying claim")
+                        page.wait_for_timeout(3000)
                         break
+                else:
+                    self._logger.error("Login timeout")
+                    return ClaimStatus.FAILED
+                # After login, the redirect should land on the purchase
+                # page — restart checkout detection
+                continue
 
-                    # Check for strong success/already-owned signals only
-                    # (no optimistic fallback — checkout may still be loading)
-                    text = self._get_page_text(page)
-                    url = page.url
-
-                    if any(pat in text for pat in ALREADY_OWNED_PATTERNS):
-                        self._logger.info(f"Already owned: {title}")
-                        return ClaimStatus.ALREADY_OWNED
-
-                    # Only trust success patterns if URL changed from
-                    # product page (avoids matching game descriptions
-                    # or localization strings embedded in page text)
-                    url_changed = url != original_url
-                    purchase_url = any(
-                        kw in url
-                        for kw in ("receipt", "confirmation", "purchase/success")
-                    )
-                    if purchase_url or (
-                        url_changed and any(pat in text for pat in SUCCESS_PATTERNS)
-                    ):
-                        self._logger.info(
-                            "Order completed automatically (no checkout needed)"
-                        )
-                        return ClaimStatus.CLAIMED
+            if retry < 9:
+                self._logger.debug("Checkout button not found yet... (attempt %s/10)", retry + 1)
+                page.wait_for_timeout(2000)
 
-                    # Detect login redirect after clicking claim
-                    if "login" in url.lower() or "id/login" in url.lower():
-                        self._logger.warning(
-                            "Redirected to login after click — waiting for login..."
-                        )
-                        for _w in range(40):
-                            page.wait_for_timeout(3000)
-                            if "login" not in page.url.lower():
-                                self._logger.info("Login completed — retrying claim")
-                                page.wait_for_timeout(3000)
-                                break
-                        else:
-                            self._logger.error("Login timeout")
-                            return ClaimStatus.FAILED
-                        # After login, the redirect should land on the purchase
-                        # page — restart checkout detection
-                        continue
+        if not checkout_button:
+            self._logger.warning(
+                "Checkout button not found -- trying direct purchase URL..."
+            )
+            self._save_debug_artifact(page, "no_checkout_button")
 
-                    if retry < 9:
-                        self._logger.debug(
-                            f"Checkout button not found yet... (attempt {retry + 1}/10)"
-                        )
-                        page.wait_for_timeout(2000)
+            # Fallback: navigate to the direct purchase page
+            purchase_url = (
+                f"https://www.epicgames.com/store/purchase"
+                f"?offers=1-{namespace}-{offer_id}"
+            )
+            self._logger.info(f"Navigating to: {purchase_url}")
+            page.goto(purchase_url, wait_until="load", timeout=60000)
+            page.wait_for_timeout(5000)
 
-                if not checkout_button:
-                    self._logger.warning(
-                        "Checkout button not found -- trying direct purchase URL..."
-                    )
-                    self._save_debug_artifact(page, "no_checkout_button")
+            # Handle age gate on direct purchase page
+            self._handle_age_gate(page)
 
-                    # Fallback: navigate to the direct purchase page
-                    purchase_url = (
-                        f"https://www.epicgames.com/store/purchase"
-                        f"?offers=1-{namespace}-{offer_id}"
-                    )
-                    self._logger.info(f"Navigating to: {purchase_url}")
-                    page.goto(purchase_url, wait_until="load", timeout=60000)
-                    page.wait_for_timeout(5000)
+            # Look for checkout button on Direct purchase page
+            for retry2 in range(8):
+                checkout_button = self._find_button(
+                    page, CHECKOUT_SELECTORS, timeout=3000
+                )
+                if checkout_button:
+                    break
+
+                text = self._get_page_text(page)
+                if any(pat in text for pat in ALREADY_OWNED_PATTERNS):
+                    self._logger.info(f"Already owned: {title}")
+                    return ClaimStatus.ALREADY_OWNED
+                if any(pat in text for pat in SUCCESS_PATTERNS):
+                    return ClaimStatus.CLAIMED
 
-                    # Handle age gate on direct purchase page
-                    self._handle_age_gate(page)
+                # Handle age gate in purchase flow too
+                self._handle_age_gate(page)
 
-                    # Look for checkout button on Direct purchase page
-                    for retry2 in range(8):
-                        checkout_button = self._find_button(
-                            page, CHECKOUT_SELECTORS, timeout=3000
-                        )
-                        if checkout_button:
-                            break
-
-                        text = self._get_page_text(page)
-                        if any(pat in text for pat in ALREADY_OWNED_PATTERNS):
-                            self._logger.info(f"Already owned: {title}")
-                            return ClaimStatus.ALREADY_OWNED
-                        if any(pat in text for pat in SUCCESS_PATTERNS):
-                            return ClaimStatus.CLAIMED
-
-                        # Handle age gate in purchase flow too
-                        self._handle_age_gate(page)
-
-                        if retry2 < 7:
-                            self._logger.debug(
-                                f"Direct purchase: waiting... ({retry2 + 1}/8)"
-                            )
-                            page.wait_for_timeout(2000)
-
-                    if not checkout_button:
-                        # Save final debug info
-                        import os as _os
-                        _os.makedirs(self.config.debug_dir, exist_ok=True)
-                        with contextlib.suppress(Exception):
-                            html_path = _os.path.join(
-                                self.config.debug_dir, "no_checkout_page.html"
-                            )
-                            with open(html_path, "w", encoding="utf-8") as f:
-                                f.write(page.content())
-                        with contextlib.suppress(Exception):
-                            text_path = _os.path.join(
-                                self.config.debug_dir, "no_checkout_text.txt"
-                            )
-                            text_content = self._get_page_text(page)
-                            with open(text_path, "w", encoding="utf-8") as f:
-                                f.write(f"URL: {page.url}\n\n{text_content}")
-                        with contextlib.suppress(Exception):
-                            self._logger.debug(f"Page URL: {page.url}")
-                            self._logger.debug(
-                                f"Frames: {[f.url for f in page.frames]}"
-                            )
+                if retry2 < 7:
+                    self._logger.debug("Direct purchase: waiting... (%s/8)", retry2 + 1)
+                    page.wait_for_timeout(2000)
 
-                if checkout_button:
-                    self._logger.info("Checkout step detected -- clicking 'Place Order'...")
-
-                    # Click checkout FIRST, then handle CAPTCHA if it appears.
-                    # Epic's Talon SDK runs invisible hCaptcha automatically;
-                    # clicking the button triggers it.
-                    refreshed = self._find_button(
-                        page,
-                        CHECKOUT_SELECTORS,
-                        timeout=1500,
+            if not checkout_button:
+                # Save final debug info
+                import os as _os
+                _os.makedirs(self.config.debug_dir, exist_ok=True)
+                with contextlib.suppress(Exception):
+                    html_path = _os.path.join(
+                        self.config.debug_dir, "no_checkout_page.html"
                     )
-                    btn = refreshed or checkout_button
-                    try:
-                        btn.click(timeout=15000)
-                    except Exception:
-                        try:
-                            btn.click(force=True, timeout=15000)
-                        except Exception as e:
-                            self._logger.warning(f"Checkout click failed: {e}")
-
-                    page.wait_for_timeout(5000)
-
-                    # Check if order already completed (invisible CAPTCHA auto-passed)
-                    result = self._check_page_result(page)
-                    if result in (ClaimStatus.CLAIMED, ClaimStatus.ALREADY_OWNED):
-                        self._logger.info("Order completed (no visible CAPTCHA)")
-                        self._save_debug_artifact(page, "final_state")
-                        return result
-
-                    # If CAPTCHA is visible, wait for user to solve it
-                    if self._has_captcha(page):
-                        self._save_debug_artifact(page, "captcha_detected")
-                        resolved = self._wait_for_captcha_resolution(page)
-
-                        if not resolved:
-                            text = self._get_page_text(page)
-                            if any(pat in text for pat in RATE_LIMIT_PATTERNS):
-                                return ClaimStatus.RATE_LIMITED
-                            return ClaimStatus.FAILED
-
-                        # Post-CAPTCHA: Talon SDK often auto-submits the order.
-                        self._logger.info("CAPTCHA resolved -- waiting for Talon auto-submit...")
-                        page.wait_for_timeout(5000)
+                    with open(html_path, "w", encoding="utf-8") as f:
+                        f.write(page.content())
+                with contextlib.suppress(Exception):
+                    text_path = _os.path.join(
+                        self.config.debug_dir, "no_checkout_text.txt"
+                    )
+                    text_content = self._get_page_text(page)
+                    with open(text_path, "w", encoding="utf-8") as f:
+                        f.write(f"URL: {page.url}\n\n{text_content}")
+                if self._logger.enabled(logging.DEBUG):
+                    with contextlib.suppress(Exception):
+                        self._logger.debug("Page URL: %s", page.url)
+                        # Listing the frames walks the page; skip it unless logged
+                        self._logger.debug("Frames: %s", [f.url for f in page.frames])
+
+        if checkout_button:
+            self._logger.info("Checkout step detected -- clicking 'Place Order'...")
+
+            # Click checkout FIRST, then handle CAPTCHA if it appears.
+            # Epic's Talon SDK runs invisible hCaptcha automatically;
+            # clicking the button triggers it.
+            refreshed = self._find_button(
+                page,
+                CHECKOUT_SELECTORS,
+                timeout=1500,
+            )
+            btn = refreshed or checkout_button
+            try:
+                btn.click(timeout=15000)
+            except Exception:
+                try:
+                    btn.click(force=True, timeout=15000)
+                except Exception as e:
+                    self._logger.warning(f"Checkout click failed: {e}")
 
-                        result = self._check_page_result(page)
-                        if result in (ClaimStatus.CLAIMED, ClaimStatus.ALREADY_OWNED):
-                            self._logger.info("Order completed via Talon auto-submit")
-                            self._save_debug_artifact(page, "final_state")
-                            return result
-
-                        # Talon didn't auto-submit: try clicking checkout again
-                        self._logger.info("Auto-submit didn't fire -- clicking checkout manually")
-                        refreshed = self._find_button(
-                            page,
-                            CHECKOUT_SELECTORS,
-                            timeout=1500,
-                        )
-                        if refreshed:
-                            try:
-                                refreshed.click(force=True, timeout=15000)
-                                page.wait_for_timeout(5000)
-                            except Exception as e:
-                                self._logger.warning(f"Retry checkout click failed: {e}")
-                    else:
-                        # No CAPTCHA but order not confirmed — wait a bit more
-                        self._logger.debug("No CAPTCHA detected, waiting for page to settle...")
-                        page.wait_for_timeout(5000)
+            page.wait_for_timeout(5000)
 
-                # --- Step 3: Determine result ---
+            # Check if order already completed (invisible CAPTCHA auto-passed)
+            result = self._check_page_result(page)
+            if result in (ClaimStatus.CLAIMED, ClaimStatus.ALREADY_OWNED):
+                self._logger.info("Order completed (no visible CAPTCHA)")
                 self._save_debug_artifact(page, "final_state")
-                return self._check_page_result(page)
+                return result
 
-        except Exception as e:
-            self._logger.error(f"Browser claim error: {e}")
-            return ClaimStatus.FAILED
-        finally:
-            browser_mgr.close()
+            # If CAPTCHA is visible, wait for user to solve it
+            if self._has_captcha(page):
+                self._save_debug_artifact(page, "captcha_detected")
+                resolved = self._wait_for_captcha_resolution(page)
+
+                if not resolved:
+                    text = self._get_page_text(page)
+                    if any(pat in text for pat in RATE_LIMIT_PATTERNS):
+                        return ClaimStatus.RATE_LIMITED
+                    return ClaimStatus.FAILED
+
+                # Post-CAPTCHA: Talon SDK often auto-submits the order.
+                self._logger.info("CAPTCHA resolved -- waiting for Talon auto-submit...")
+                page.wait_for_timeout(5000)
+
+                result = self._check_page_result(page)
+                if result in (ClaimStatus.CLAIMED, ClaimStatus.ALREADY_OWNED):
+                    self._logger.info("Order completed via Talon auto-submit")
+                    self._save_debug_artifact(page, "final_state")
+                    return result
+
+                # Talon didn't auto-submit: try clicking checkout again
+                self._logger.info("Auto-submit didn't fire -- clicking checkout manually")
+                refreshed = self._find_button(
+                    page,
+                    CHECKOUT_SELECTORS,
+                    timeout=1500,
+                )
+                if refreshed:
+                    try:
+                        refreshed.click(force=True, timeout=15000)
+                        page.wait_for_timeout(5000)
+                    except Exception as e:
+                        self._logger.warning(f"Retry checkout click failed: {e}")
+            else:
+                # No CAPTCHA but order not confirmed — wait a bit more
+                self._logger.debug("No CAPTCHA detected, waiting for page to settle...")
+                page.wait_for_timeout(5000)
+
+        # --- Step 3: Determine result ---
+        self._save_debug_artifact(page, "final_state")
+        return self._check_page_result(page)
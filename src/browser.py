@@ -12,18 +12,120 @@ hCaptcha's invisible mode sees a genuine browser fingerprint with
 real cookies, extensions, and browsing history.
 """
 
+import functools
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
+import psutil
+
 from .config import Config
 from .logger import Logger
 
 
+def _fast_rmtree(path: Path) -> None:
+    """
+    Remove a directory tree as quickly as the platform allows.
+
+    On Windows, ``rd /s /q`` deletes natively and is much faster than
+    ``shutil.rmtree`` on profiles with thousands of small files.  Falls
+    back to ``shutil.rmtree`` elsewhere or if ``rd`` fails.
+    """
+    if os.name == "nt":
+        try:
+            result = subprocess.run(
+                ["cmd", "/c", "rd", "/s", "/q", str(path)],
+                capture_output=True,
+                timeout=30,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+            if result.returncode == 0 and not path.exists():
+                return
+        except Exception:
+            pass
+
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@functools.cache
+def _locate_chrome(custom_path: str = "") -> Path | None:
+    """
+    Locate the Chrome executable.
+
+    Candidates are grouped by parent directory and each directory is
+    listed once with ``os.scandir`` instead of stat-ing every candidate.
+    The result is cached since Chrome doesn't move during a run.
+
+    Args:
+        custom_path: User-configured executable path (CHROME_EXE_PATH).
+
+    Returns:
+        Path to the executable, or None if not found.
+    """
+    # User-configured path
+    if custom_path:
+        custom = Path(custom_path)
+        if custom.is_file():
+            return custom
+
+    candidates: list[Path] = []
+
+    # Chrome on PATH takes precedence over the default install locations
+    chrome_on_path = shutil.which("chrome") or shutil.which("google-chrome")
+    if chrome_on_path:
+        candidates.append(Path(chrome_on_path))
+
+    # Common Windows paths
+    for env_var in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA"):
+        base = os.environ.get(env_var, "")
+        if base:
+            candidates.append(Path(base) / "Google" / "Chrome" / "Application" / "chrome.exe")
+
+    listings: dict[Path, set[str] | None] = {}
+    for candidate in candidates:
+        parent = candidate.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = None
+        names = listings[parent]
+        if names and candidate.name in names:
+            return candidate
+
+    return None
+
+
+def _rmtree_in_background(path: Path) -> None:
+    """Delete *path* on a daemon thread so the caller isn't blocked."""
+    threading.Thread(target=_fast_rmtree, args=(path,), daemon=True).start()
+
+
+def _watch_devtools(stream: Any, ready: threading.Event) -> None:
+    """
+    Drain Chrome's stderr and set *ready* once the CDP endpoint is up.
+
+    Chrome prints ``DevTools listening on ws://...`` as soon as the
+    debugging port accepts connections.  The stream is read to EOF so
+    the pipe never fills up and blocks Chrome; EOF also sets *ready* so
+    the waiter doesn't sit out the full timeout if Chrome dies early.
+    """
+    try:
+        for raw in iter(stream.readline, b""):
+            if b"DevTools listening on" in raw:
+                ready.set()
+    except (OSError, ValueError):
+        pass
+    finally:
+        ready.set()
+
+
 class BrowserManager:
     """
     Manages browser lifecycle for claiming games.
@@ -39,6 +141,39 @@ class BrowserManager:
         "--disable-dev-shm-usage",
     ]
 
+    # Prefix of the temp profile copies created by _launch_real_chrome
+    TEMP_PROFILE_PREFIX = "epic_chrome_"
+
+    # Profile sub-directories skipped when copying the full profile
+    IGNORE_NAMES = frozenset({
+        "Cache", "Code Cache", "GPUCache", "Service Worker",
+        "CacheStorage", "blob_storage", "IndexedDB",
+        "File System", "GCM Store",
+    })
+
+    # Files needed for an authenticated session (CHROME_MINIMAL_PROFILE):
+    # top-level files of "User Data", then files relative to the profile
+    MINIMAL_ROOT_FILES = ("Local State", "First Run")
+    MINIMAL_PROFILE_FILES = (
+        "Preferences",
+        "Secure Preferences",
+        "Cookies",
+        "Login Data",
+        "Web Data",
+        "Network/Cookies",
+        "Network/TransportSecurity",
+    )
+
+    # Leftover profile copies older than this are considered orphaned
+    ORPHAN_MAX_AGE = 3600
+
+    # Orphaned profile copies are swept once per process
+    _orphans_swept = False
+
+    # playwright_stealth is imported lazily and shared (False = unavailable)
+    _stealth_cls: Any = None
+    _stealth_instance: Any = None
+
     def __init__(self, config: Config, logger: Logger):
         self.config = config
         self._logger = logger
@@ -48,6 +183,7 @@ class BrowserManager:
         self._chrome_process: subprocess.Popen | None = None
         self._temp_profile_dir: Path | None = None
         self._using_real_chrome = False
+        self._sweep_orphaned_profiles()
 
     # =========================================================================
     # Public API
@@ -154,12 +290,10 @@ class BrowserManager:
                 pass
             self._chrome_process = None
 
-        # Clean up temporary profile copy
+        # Clean up temporary profile copy in the background — deleting
+        # thousands of profile files shouldn't hold up the next claim
         if self._temp_profile_dir and self._temp_profile_dir.exists():
-            try:
-                shutil.rmtree(self._temp_profile_dir, ignore_errors=True)
-            except Exception:
-                pass
+            _rmtree_in_background(self._temp_profile_dir)
             self._temp_profile_dir = None
 
         self._browser = None
@@ -167,6 +301,24 @@ class BrowserManager:
         self._page = None
         self._using_real_chrome = False
 
+    @classmethod
+    def _sweep_orphaned_profiles(cls) -> None:
+        """Queue background deletion of profile copies left by crashed runs."""
+        if cls._orphans_swept:
+            return
+        cls._orphans_swept = True
+
+        cutoff = time.time() - cls.ORPHAN_MAX_AGE
+        try:
+            for path in Path(tempfile.gettempdir()).glob(f"{cls.TEMP_PROFILE_PREFIX}*"):
+                try:
+                    if path.is_dir() and path.stat().st_mtime < cutoff:
+                        _rmtree_in_background(path)
+                except OSError:
+                    continue
+        except OSError:
+            pass
+
     # =========================================================================
     # Real Chrome via CDP
     # =========================================================================
@@ -177,8 +329,9 @@ class BrowserManager:
 
         Chrome refuses CDP when ``--user-data-dir`` points to its own
         default location, so we copy the user's profile into a temp
-        directory.  If Chrome is already running normally, it is killed
-        first so the profile isn't locked during the copy.
+        directory.  If Chrome is already running normally, the copy is
+        taken from a VSS snapshot when ``USE_VSS_SNAPSHOT`` is enabled;
+        otherwise Chrome is killed first so the profile isn't locked.
 
         Returns:
             A Playwright Page, or None if connection fails.
@@ -201,49 +354,41 @@ class BrowserManager:
             self._logger.warning("Diretório de perfil do Chrome não encontrado")
             return None
 
-        # Close any running Chrome that locks the profile directory
+        # Chrome holds locks on the profile while running.  Either copy
+        # from a VSS snapshot (Chrome keeps running) or close it first.
+        copy_root = src_profile
+        shadow_id: str | None = None
         if self._is_chrome_running():
-            self._logger.info(
-                "Chrome já está aberto — fechando para relançar com CDP..."
-            )
-            self._kill_chrome_processes()
-            for _ in range(15):
-                if not self._is_chrome_running():
-                    break
-                time.sleep(1)
-            else:
-                self._logger.warning("Chrome não fechou a tempo")
-                return None
-            time.sleep(2)
+            if self.config.use_vss_snapshot:
+                snapshot = self._snapshot_profile_via_vss(src_profile)
+                if snapshot:
+                    shadow_id, copy_root = snapshot
+
+            if shadow_id is None:
+                self._logger.info(
+                    "Chrome já está aberto — fechando para relançar com CDP..."
+                )
+                procs = self._kill_chrome_processes()
+                _, alive = psutil.wait_procs(procs, timeout=15)
+                if alive:
+                    self._logger.warning("Chrome não fechou a tempo")
+                    return None
 
         # Copy profile into a temp dir — Chrome refuses CDP on its
         # default User Data directory
         profile = self.config.chrome_profile  # e.g. "Default"
-        tmp_base = Path(tempfile.mkdtemp(prefix="epic_chrome_"))
+        tmp_base = Path(tempfile.mkdtemp(prefix=self.TEMP_PROFILE_PREFIX))
         self._temp_profile_dir = tmp_base  # cleaned up in close()
-        src_profile_sub = src_profile / profile
 
         self._logger.info(f"Copiando perfil '{profile}' para {tmp_base}...")
         try:
-            dst_profile = tmp_base / profile
-            shutil.copytree(
-                src_profile_sub,
-                dst_profile,
-                ignore=shutil.ignore_patterns(
-                    "Cache", "Code Cache", "GPUCache", "Service Worker",
-                    "CacheStorage", "blob_storage", "IndexedDB",
-                    "File System", "GCM Store",
-                ),
-                dirs_exist_ok=True,
-            )
-            # Also copy essential top-level files (Local State, etc.)
-            for fname in ("Local State",):
-                src_file = src_profile / fname
-                if src_file.exists():
-                    shutil.copy2(src_file, tmp_base / fname)
+            self._copy_profile(copy_root, tmp_base, profile)
         except Exception as e:
             self._logger.warning(f"Falha ao copiar perfil: {e}")
             return None
+        finally:
+            if shadow_id:
+                self._delete_vss_snapshot(shadow_id)
 
         self._logger.info(f"Iniciando Chrome real com CDP na porta {port}...")
 
@@ -257,22 +402,40 @@ class BrowserManager:
         ]
 
         try:
+            # CREATE_NO_WINDOW keeps Windows from allocating a console for
+            # Chrome; close_fds stops our own handles leaking into it.
             self._chrome_process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+                stderr=subprocess.PIPE,
+                creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+                | getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                close_fds=True,
             )
-            # Wait for Chrome to start and open CDP port
-            for i in range(25):
-                time.sleep(1)
-                if self._try_cdp_connect(playwright, cdp_url):
-                    return self._page
-                if i == 9:
-                    self._logger.debug("Ainda aguardando Chrome iniciar...")
-
-            self._logger.warning("Chrome não respondeu no CDP após 25s")
-            return None
+            # Wait for Chrome to announce the CDP endpoint on stderr
+            deadline = time.monotonic() + 25
+            ready = threading.Event()
+            threading.Thread(
+                target=_watch_devtools,
+                args=(self._chrome_process.stderr, ready),
+                daemon=True,
+            ).start()
+            ready.wait(timeout=25)
+
+            # The banner usually means the port is up, but the first connect
+            # can still fail (or the banner never shows up), so retry with
+            # backoff until the deadline or until Chrome exits
+            delay = 0.25
+            while not self._try_cdp_connect(playwright, cdp_url):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._chrome_process.poll() is not None:
+                    self._logger.warning(
+                        "Chrome não abriu o endpoint CDP (timeout 25s ou processo encerrado)"
+                    )
+                    return None
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 2.0)
+            return self._page
 
         except FileNotFoundError:
             self._logger.warning(f"Chrome não encontrado: {chrome_exe}")
@@ -281,30 +444,138 @@ class BrowserManager:
             self._logger.warning(f"Falha ao iniciar Chrome: {e}")
             return None
 
+    @staticmethod
+    def _chrome_processes() -> list[psutil.Process]:
+        """List running Chrome processes."""
+        procs = []
+        for proc in psutil.process_iter(["name"]):
+            if (proc.info["name"] or "").lower() in ("chrome.exe", "chrome"):
+                procs.append(proc)
+        return procs
+
     def _is_chrome_running(self) -> bool:
         """Check if any Chrome process is currently running."""
+        try:
+            return bool(self._chrome_processes())
+        except Exception:
+            return False
+
+    def _copy_profile(self, src_root: Path, dst_root: Path, profile: str) -> None:
+        """
+        Copy a Chrome profile into a fresh user data directory.
+
+        With ``CHROME_MINIMAL_PROFILE`` enabled only the files needed for
+        an authenticated session are copied; otherwise the whole profile
+        is copied minus caches.
+
+        Args:
+            src_root: Source "User Data" directory (or its VSS snapshot).
+            dst_root: Destination user data directory.
+            profile: Profile folder name (e.g. "Default").
+        """
+        if self.config.chrome_minimal_profile:
+            files = [*self.MINIMAL_ROOT_FILES, *(f"{profile}/{f}" for f in self.MINIMAL_PROFILE_FILES)]
+            for rel in files:
+                src_file = src_root / rel
+                if src_file.is_file():
+                    dst_file = dst_root / rel
+                    dst_file.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(src_file, dst_file)
+            return
+
+        shutil.copytree(
+            src_root / profile,
+            dst_root / profile,
+            ignore=lambda _dir, names: [n for n in names if n in self.IGNORE_NAMES],
+            dirs_exist_ok=True,
+        )
+        # Also copy essential top-level files (Local State, etc.)
+        for fname in ("Local State",):
+            src_file = src_root / fname
+            if src_file.exists():
+                shutil.copy2(src_file, dst_root / fname)
+
+    def _snapshot_profile_via_vss(self, user_data_dir: Path) -> tuple[str, Path] | None:
+        """
+        Create a Volume Shadow Copy of the drive holding the Chrome profile.
+
+        Lets us copy a consistent, unlocked view of the profile while the
+        user's Chrome keeps running.  Requires administrator rights.
+
+        Args:
+            user_data_dir: Chrome "User Data" directory.
+
+        Returns:
+            Tuple of (shadow ID, User Data path inside the snapshot),
+            or None if the snapshot could not be created.
+        """
+        volume = user_data_dir.anchor  # e.g. "C:\\"
+        if not volume:
+            return None
+
+        script = (
+            f"$r = (Get-WmiObject -List Win32_ShadowCopy).Create('{volume}', 'ClientAccessible'); "
+            "if ($r.ReturnValue -ne 0) { exit 1 }; "
+            "$s = Get-WmiObject Win32_ShadowCopy | Where-Object { $_.ID -eq $r.ShadowID }; "
+            "Write-Output \"$($r.ShadowID)|$($s.DeviceObject)\""
+        )
+        self._logger.info("Criando snapshot VSS do perfil do Chrome...")
         try:
             result = subprocess.run(
-                ["tasklist", "/FI", "IMAGENAME eq chrome.exe", "/NH"],
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
                 capture_output=True,
                 text=True,
-                timeout=5,
+                timeout=60,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
-            return "chrome.exe" in result.stdout.lower()
-        except Exception:
-            return False
+            shadow_id, _, device = result.stdout.strip().partition("|")
+            if result.returncode != 0 or not shadow_id or not device:
+                if shadow_id:
+                    self._delete_vss_snapshot(shadow_id)
+                self._logger.warning(
+                    "Falha ao criar snapshot VSS (requer administrador)",
+                    returncode=result.returncode,
+                )
+                return None
+        except Exception as e:
+            self._logger.warning(f"Falha ao criar snapshot VSS: {e}")
+            return None
+
+        relative = user_data_dir.relative_to(user_data_dir.anchor)
+        return shadow_id, Path(device + "\\") / relative
 
-    def _kill_chrome_processes(self) -> None:
-        """Gracefully terminate all Chrome processes."""
+    def _delete_vss_snapshot(self, shadow_id: str) -> None:
+        """Delete a shadow copy created by ``_snapshot_profile_via_vss``."""
         try:
             subprocess.run(
-                ["taskkill", "/IM", "chrome.exe", "/F"],
+                ["vssadmin", "delete", "shadows", f"/Shadow={shadow_id}", "/Quiet"],
                 capture_output=True,
-                timeout=10,
+                timeout=30,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
-            time.sleep(2)
         except Exception as e:
-            self._logger.debug(f"Erro ao fechar Chrome: {e}")
+            self._logger.debug("Erro ao remover snapshot VSS: %s", e)
+
+    def _kill_chrome_processes(self) -> list[psutil.Process]:
+        """
+        Terminate all Chrome processes.
+
+        Returns:
+            The processes that were signalled, for ``psutil.wait_procs``.
+        """
+        killed = []
+        try:
+            for proc in self._chrome_processes():
+                try:
+                    proc.kill()
+                    killed.append(proc)
+                except psutil.NoSuchProcess:
+                    pass
+                except psutil.AccessDenied as e:
+                    self._logger.debug("Sem permissão para fechar Chrome (PID %s)", e.pid)
+        except Exception as e:
+            self._logger.debug("Erro ao fechar Chrome: %s", e)
+        return killed
 
     def _try_cdp_connect(self, playwright: Any, cdp_url: str) -> bool:
         """
@@ -337,42 +608,8 @@ class BrowserManager:
             return False
 
     def _find_chrome_executable(self) -> Path | None:
-        """Find Chrome executable on the system."""
-        # User-configured path
-        if self.config.chrome_exe_path:
-            custom = Path(self.config.chrome_exe_path)
-            if custom.exists():
-                return custom
-
-        # Common Windows paths
-        candidates = [
-            Path(os.environ.get("PROGRAMFILES", ""))
-            / "Google"
-            / "Chrome"
-            / "Application"
-            / "chrome.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", ""))
-            / "Google"
-            / "Chrome"
-            / "Application"
-            / "chrome.exe",
-            Path(os.environ.get("LOCALAPPDATA", ""))
-            / "Google"
-            / "Chrome"
-            / "Application"
-            / "chrome.exe",
-        ]
-
-        # Also check if chrome is on PATH
-        chrome_on_path = shutil.which("chrome") or shutil.which("google-chrome")
-        if chrome_on_path:
-            candidates.insert(0, Path(chrome_on_path))
-
-        for candidate in candidates:
-            if candidate and candidate.exists():
-                return candidate
-
-        return None
+        """Find Chrome executable on the system (cached per process)."""
+        return _locate_chrome(self.config.chrome_exe_path)
 
     def _get_chrome_user_data_dir(self) -> Path | None:
         """Get Chrome user data directory."""
@@ -449,13 +686,31 @@ class BrowserManager:
         self._page = self._context.new_page()
 
         # Apply stealth patches
-        try:
-            from playwright_stealth import Stealth
-
-            stealth = Stealth()
+        stealth = self._get_stealth()
+        if stealth:
             stealth.apply_stealth_sync(self._page)
-        except ImportError:
+        else:
             self._logger.debug("playwright-stealth não disponível, prosseguindo sem stealth")
 
         self._using_real_chrome = False
         return self._page
+
+    @classmethod
+    def _get_stealth(cls) -> Any | None:
+        """
+        Get the shared ``Stealth`` instance, importing it on first use.
+
+        The import and the bundled JS patches are loaded once per process.
+
+        Returns:
+            A ``playwright_stealth.Stealth`` instance, or None if unavailable.
+        """
+        if cls._stealth_cls is None:
+            try:
+                from playwright_stealth import Stealth
+            except ImportError:
+                cls._stealth_cls = False
+                return None
+            cls._stealth_cls = Stealth
+            cls._stealth_instance = Stealth()
+        return cls._stealth_instance
@@ -5,38 +5,167 @@ Automatically extracts EPIC_EG1 and CF_CLEARANCE cookies from Chrome
 using Windows DPAPI decryption. No browser UI required.
 """
 
-import contextlib
-import json
+import functools
+import hashlib
+import mmap
 import os
-import shutil
 import sqlite3
-import tempfile
+import struct
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .models import ExtractedCookies
+from .models import COOKIE_FIELDS, ExtractedCookies
+from .utils import atomic_write_bytes, ensure_dir, json_loads
 
 
-try:
-    import win32crypt  # type: ignore
+# Windows DPAPI via ctypes (same API pywin32's win32crypt wraps)
+HAS_DPAPI = os.name == "nt"
 
-    HAS_WIN32CRYPT = True
-except ImportError:
-    win32crypt = None  # type: ignore
-    HAS_WIN32CRYPT = False
 
-# AES decryption for Chrome v80+ cookies
-try:
-    from cryptography.hazmat.backends import default_backend  # type: ignore
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # type: ignore
+@functools.cache
+def _dpapi_api() -> tuple[Any, Any]:
+    """Import ctypes and define the DATA_BLOB struct on first DPAPI use."""
+    import ctypes
+    from ctypes import wintypes
 
-    HAS_CRYPTOGRAPHY = True
-except ImportError:
-    Cipher = None  # type: ignore
-    algorithms = None  # type: ignore
-    modes = None  # type: ignore
-    default_backend = None  # type: ignore
-    HAS_CRYPTOGRAPHY = False
+    class DataBlob(ctypes.Structure):
+        _fields_ = [
+            ("cbData", wintypes.DWORD),
+            ("pbData", ctypes.POINTER(ctypes.c_char)),
+        ]
+
+    return ctypes, DataBlob
+
+
+def _dpapi_call(func_name: str, data: bytes) -> bytes:
+    """Run CryptProtectData/CryptUnprotectData on *data* and return the output blob."""
+    if not HAS_DPAPI:
+        raise OSError("DPAPI só está disponível no Windows")
+
+    ctypes, DataBlob = _dpapi_api()
+    buf = ctypes.create_string_buffer(data, len(data))
+    in_blob = DataBlob(len(data), ctypes.cast(buf, ctypes.POINTER(ctypes.c_char)))
+    out_blob = DataBlob()
+    if not getattr(ctypes.windll.crypt32, func_name)(
+        ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob)
+    ):
+        raise ctypes.WinError()
+    try:
+        return ctypes.string_at(out_blob.pbData, out_blob.cbData)
+    finally:
+        ctypes.windll.kernel32.LocalFree(out_blob.pbData)
+
+
+def _dpapi_unprotect(blob: bytes) -> bytes:
+    """
+    Decrypt a DPAPI blob for the current user.
+
+    Args:
+        blob: Encrypted bytes.
+
+    Returns:
+        Decrypted bytes.
+
+    Raises:
+        OSError: If CryptUnprotectData fails or DPAPI is unavailable.
+    """
+    return _dpapi_call("CryptUnprotectData", blob)
+
+
+def _dpapi_protect(data: bytes) -> bytes:
+    """
+    Encrypt bytes with DPAPI, scoped to the current user.
+
+    Args:
+        data: Plain bytes.
+
+    Returns:
+        Encrypted DPAPI blob.
+
+    Raises:
+        OSError: If CryptProtectData fails or DPAPI is unavailable.
+    """
+    return _dpapi_call("CryptProtectData", data)
+
+
+# Encrypted cookie prefixes that use AES-GCM (Chrome v80+)
+_GCM_PREFIXES = frozenset({b"v10", b"v11", b"v20"})
+
+
+@functools.lru_cache(maxsize=4)
+def _gcm_decryptor(key: bytes) -> Callable[[memoryview, memoryview], bytes] | None:
+    """
+    Build an AES-GCM decrypt function for *key*.
+
+    pycryptodome (``Cryptodome`` from pycryptodomex, or ``Crypto``) is
+    preferred: its thin C extension has less per-call overhead than
+    cryptography's cffi/OpenSSL path for tiny cookie values.  A legacy
+    PyCrypto install also provides ``Crypto`` but has no GCM mode, so it
+    falls through to cryptography.  Decryptors are cached per key so a
+    long-running process (the scheduler creates a new extractor every
+    run) keeps reusing the same cipher context instead of rebuilding it.
+
+    Args:
+        key: AES-256 master key.
+
+    Returns:
+        ``decrypt(nonce, ciphertext_and_tag) -> plaintext``, or None if no
+        backend is installed.
+    """
+    try:
+        from Cryptodome.Cipher import AES  # type: ignore
+    except ImportError:
+        try:
+            from Crypto.Cipher import AES  # type: ignore
+        except ImportError:
+            AES = None  # type: ignore
+
+    if AES is not None and hasattr(AES, "MODE_GCM"):
+
+        def decrypt(nonce: memoryview, data: memoryview) -> bytes:
+            cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+            return cipher.decrypt_and_verify(data[:-16], data[-16:])
+
+        return decrypt
+
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # type: ignore
+    except ImportError:
+        return None
+
+    # AESGCM keeps the expanded key schedule across calls
+    aesgcm = AESGCM(key)
+    return lambda nonce, data: aesgcm.decrypt(nonce, data, None)
+
+
+def _read_encrypted_key(local_state_path: Path) -> str:
+    """
+    Read ``os_crypt.encrypted_key`` from Chrome's Local State file.
+
+    Local State is a few hundred KB of JSON but only one value is needed,
+    so the mapped file is scanned for the key directly; the full JSON
+    parse is only a fallback.
+
+    Args:
+        local_state_path: Path to the Local State file.
+
+    Returns:
+        Base64 encrypted key, or empty string if not present.
+    """
+    marker = b'"encrypted_key":"'
+    with open(local_state_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = mm.find(marker)
+        if start != -1:
+            start += len(marker)
+            end = mm.find(b'"', start)
+            if end != -1:
+                return mm[start:end].decode("ascii")
+        data = mm[:]
+
+    local_state = json_loads(data)
+    return local_state.get("os_crypt", {}).get("encrypted_key", "")
 
 
 class ChromeCookieExtractor:
@@ -51,17 +180,34 @@ class ChromeCookieExtractor:
     # Default Chrome profile name (can be overridden via env or arg)
     DEFAULT_PROFILE = "Default"
 
-    # Epic Games domains to search
+    # Epic Games host_key values as stored by Chrome (exact match, so the
+    # query can use the host_key index)
     EPIC_DOMAINS = [
         ".epicgames.com",
         "epicgames.com",
         "store.epicgames.com",
         ".store.epicgames.com",
+        "www.epicgames.com",
+        ".www.epicgames.com",
     ]
 
+    # Key cache header: Local State mtime_ns + encrypted key fingerprint
+    _KEY_CACHE_HEADER = struct.Struct("<Q16s")
+
+    # Below this many encrypted rows, thread pool startup costs more than it saves
+    _PARALLEL_DECRYPT_MIN = 8
+
     # Cookies to extract
     TARGET_COOKIES = ["EPIC_EG1", "EPIC_SSO", "cf_clearance", "REFRESH_EPIC_EG1", "bearerTokenHash"]
 
+    # Cookie query, built once from the constants above
+    _QUERY = (
+        "SELECT name, encrypted_value, value FROM cookies"
+        f" WHERE host_key IN ({','.join('?' * len(EPIC_DOMAINS))})"
+        f" AND name IN ({','.join('?' * len(TARGET_COOKIES))})"
+    )
+    _QUERY_PARAMS = (*EPIC_DOMAINS, *TARGET_COOKIES)
+
     def __init__(self, profile_name: str | None = None, logger: Any = None):
         """
         Initialize extractor.
@@ -75,15 +221,17 @@ class ChromeCookieExtractor:
         self.profile_name = profile_name or os.getenv("CHROME_PROFILE", self.DEFAULT_PROFILE)
         self._logger = logger
         self._encryption_key: bytes | None = None
+        self._gcm_decrypt: Callable[[memoryview, memoryview], bytes] | None = None
 
-    def _log(self, level: str, message: str, **kwargs) -> None:
-        """Log message if logger available."""
+    def _log(self, level: str, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log message if logger available (``args`` are %-formatted lazily)."""
         if self._logger:
-            getattr(self._logger, level, self._logger.info)(message, **kwargs)
+            getattr(self._logger, level, self._logger.info)(message, *args, **kwargs)
 
-    def get_chrome_path(self) -> Path | None:
+    @functools.cached_property
+    def chrome_path(self) -> Path | None:
         """
-        Get Chrome user data directory path.
+        Chrome user data directory path (resolved once per extractor).
 
         Returns:
             Path to Chrome User Data folder or None.
@@ -98,16 +246,17 @@ class ChromeCookieExtractor:
 
         return None
 
-    def get_profile_path(self) -> Path | None:
+    @functools.cached_property
+    def profile_path(self) -> Path | None:
         """
-        Get path to configured Chrome profile.
+        Path to configured Chrome profile (resolved once per extractor).
 
         Falls back to 'Default' profile if configured profile doesn't exist.
 
         Returns:
             Path to profile folder or None.
         """
-        chrome_path = self.get_chrome_path()
+        chrome_path = self.chrome_path
         if not chrome_path:
             self._log("error", "Chrome não encontrado")
             return None
@@ -128,11 +277,36 @@ class ChromeCookieExtractor:
         self._log("error", f"Perfil não encontrado: {self.profile_name}")
         return None
 
+    @functools.cached_property
+    def cookies_db_path(self) -> Path | None:
+        """Path to the profile's Cookies database, or None if not found."""
+        profile_path = self.profile_path
+        if not profile_path:
+            return None
+
+        cookies_db = profile_path / "Cookies"
+        if not cookies_db.exists():
+            # Try Network subfolder (newer Chrome versions)
+            cookies_db = profile_path / "Network" / "Cookies"
+            if not cookies_db.exists():
+                return None
+        return cookies_db
+
+    def get_chrome_path(self) -> Path | None:
+        """Get Chrome user data directory path."""
+        return self.chrome_path
+
+    def get_profile_path(self) -> Path | None:
+        """Get path to configured Chrome profile."""
+        return self.profile_path
+
     def get_encryption_key(self) -> bytes | None:
         """
         Get Chrome's cookie encryption key.
 
         Chrome v80+ uses AES-256-GCM with a key stored in Local State.
+        The decrypted key is cached on disk (DPAPI-wrapped); while Local
+        State is unchanged the cache is used without reading Local State.
 
         Returns:
             Decrypted AES key or None.
@@ -140,23 +314,37 @@ class ChromeCookieExtractor:
         if self._encryption_key:
             return self._encryption_key
 
-        chrome_path = self.get_chrome_path()
+        chrome_path = self.chrome_path
         if not chrome_path:
             return None
 
         local_state_path = chrome_path / "Local State"
-        if not local_state_path.exists():
+        try:
+            mtime_ns = local_state_path.stat().st_mtime_ns
+        except OSError:
             self._log("debug", "Local State não encontrado")
             return None
 
         try:
-            with open(local_state_path, encoding="utf-8") as f:
-                local_state = json.load(f)
+            cache = self._read_key_cache()
+            if cache and cache[0] == mtime_ns:
+                self._encryption_key = self._unwrap_cached_key(cache[2])
+                if self._encryption_key:
+                    return self._encryption_key
 
-            encrypted_key_b64 = local_state.get("os_crypt", {}).get("encrypted_key", "")
+            encrypted_key_b64 = _read_encrypted_key(local_state_path)
             if not encrypted_key_b64:
                 return None
 
+            # Local State is rewritten often; the key itself only changes
+            # when the fingerprint does
+            fingerprint = hashlib.sha256(encrypted_key_b64.encode()).digest()[:16]
+            if cache and cache[1] == fingerprint:
+                self._encryption_key = self._unwrap_cached_key(cache[2])
+                if self._encryption_key:
+                    self._write_key_cache(mtime_ns, fingerprint, cache[2])
+                    return self._encryption_key
+
             import base64
 
             encrypted_key = base64.b64decode(encrypted_key_b64)
@@ -166,9 +354,9 @@ class ChromeCookieExtractor:
                 encrypted_key = encrypted_key[5:]
 
             # Decrypt using Windows DPAPI
-            if HAS_WIN32CRYPT and win32crypt:
-                wc: Any = win32crypt
-                self._encryption_key = wc.CryptUnprotectData(encrypted_key, None, None, None, 0)[1]
+            if HAS_DPAPI:
+                self._encryption_key = _dpapi_unprotect(encrypted_key)
+                self._write_key_cache(mtime_ns, fingerprint, _dpapi_protect(self._encryption_key))
                 return self._encryption_key
 
         except Exception as e:
@@ -176,6 +364,57 @@ class ChromeCookieExtractor:
 
         return None
 
+    @staticmethod
+    def _key_cache_path() -> Path | None:
+        """Get the on-disk master key cache path (None if LOCALAPPDATA is unset)."""
+        local_appdata = os.getenv("LOCALAPPDATA", "")
+        if not local_appdata:
+            return None
+        return Path(local_appdata) / "EpicGamesClaimer" / "chrome_key.bin"
+
+    def _read_key_cache(self) -> tuple[int, bytes, bytes] | None:
+        """
+        Read the master key cache.
+
+        Returns:
+            Tuple of (Local State mtime_ns, key fingerprint, DPAPI-wrapped
+            key), or None if there is no usable cache.
+        """
+        cache_path = self._key_cache_path()
+        if not (HAS_DPAPI and cache_path):
+            return None
+        try:
+            data = cache_path.read_bytes()
+        except OSError:
+            return None
+        if len(data) <= self._KEY_CACHE_HEADER.size:
+            return None
+        mtime_ns, fingerprint = self._KEY_CACHE_HEADER.unpack_from(data)
+        return mtime_ns, fingerprint, data[self._KEY_CACHE_HEADER.size :]
+
+    def _unwrap_cached_key(self, wrapped_key: bytes) -> bytes | None:
+        """DPAPI-unwrap a cached master key (None if the cache is invalid)."""
+        try:
+            return _dpapi_unprotect(wrapped_key)
+        except OSError as e:
+            self._log("debug", f"Cache de chave inválido: {e}")
+            return None
+
+    def _write_key_cache(self, mtime_ns: int, fingerprint: bytes, wrapped_key: bytes) -> None:
+        """Write the DPAPI-wrapped master key with its Local State mtime and fingerprint."""
+        cache_path = self._key_cache_path()
+        if not cache_path:
+            return
+        try:
+            ensure_dir(cache_path.parent)
+            # Written through a temp file that is removed if the write fails,
+            # so no partial key file is left behind
+            atomic_write_bytes(
+                cache_path, self._KEY_CACHE_HEADER.pack(mtime_ns, fingerprint) + wrapped_key
+            )
+        except OSError as e:
+            self._log("debug", f"Não foi possível salvar cache de chave: {e}")
+
     def decrypt_cookie_value(self, encrypted_value: bytes) -> str:
         """
         Decrypt a Chrome cookie value.
@@ -194,38 +433,28 @@ class ChromeCookieExtractor:
 
         try:
             # Chrome v80+ uses 'v10', 'v11', or 'v20' prefix with AES-GCM
-            prefix = encrypted_value[:3]
-            if prefix in (b"v10", b"v11", b"v20"):
-                if not HAS_CRYPTOGRAPHY:
-                    self._log("warning", "cryptography não instalado para AES")
-                    return ""
-
-                key = self.get_encryption_key()
-                if not key:
-                    self._log("debug", "Não foi possível obter chave de criptografia")
-                    return ""
+            mv = memoryview(encrypted_value)
+            prefix = bytes(mv[:3])
+            if prefix in _GCM_PREFIXES:
+                if self._gcm_decrypt is None:
+                    key = self.get_encryption_key()
+                    if not key:
+                        self._log("debug", "Não foi possível obter chave de criptografia")
+                        return ""
+
+                    self._gcm_decrypt = _gcm_decryptor(key)
+                    if self._gcm_decrypt is None:
+                        self._log("warning", "pycryptodome/cryptography não instalado para AES")
+                        return ""
 
                 # v10/v11/v20 format: prefix(3) + nonce(12) + ciphertext + tag(16)
-                nonce = encrypted_value[3:15]
-                ciphertext = encrypted_value[15:]
-
-                if not (Cipher and algorithms and modes and default_backend):
-                    return ""
-                cipher = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=default_backend())
-                decryptor = cipher.decryptor()
-
-                # Last 16 bytes are the authentication tag
-                decrypted = decryptor.update(ciphertext[:-16])
-                decryptor.finalize_with_tag(ciphertext[-16:])
-
-                return decrypted.decode("utf-8")
+                # (memoryview slices avoid copies; ciphertext and tag stay
+                # one contiguous buffer, as AESGCM expects)
+                return self._gcm_decrypt(mv[3:15], mv[15:]).decode("utf-8")
 
             # Old DPAPI encryption (rare now)
-            elif HAS_WIN32CRYPT and win32crypt:
-                wc: Any = win32crypt
-                return wc.CryptUnprotectData(encrypted_value, None, None, None, 0)[1].decode(
-                    "utf-8"
-                )
+            elif HAS_DPAPI:
+                return _dpapi_unprotect(encrypted_value).decode("utf-8")
 
         except Exception as e:
             self._log("debug", f"Erro ao descriptografar: {e}")
@@ -244,72 +473,44 @@ class ChromeCookieExtractor:
         """
         result = ExtractedCookies()
 
-        profile_path = self.get_profile_path()
-        if not profile_path:
+        if not self.profile_path:
             return result
 
-        cookies_db = profile_path / "Cookies"
-        if not cookies_db.exists():
-            # Try Network subfolder (newer Chrome versions)
-            cookies_db = profile_path / "Network" / "Cookies"
-            if not cookies_db.exists():
-                self._log("error", "Database de cookies não encontrada")
-                return result
+        cookies_db = self.cookies_db_path
+        if not cookies_db:
+            self._log("error", "Database de cookies não encontrada")
+            return result
 
-        # Copy database to temp to avoid lock issues
-        temp_file = None
+        # Open read-only and immutable: SQLite skips locking and journaling,
+        # so the live database can be read even while Chrome holds it open
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
-                temp_file = tmp.name
-
-            shutil.copy2(cookies_db, temp_file)
-
-            # Connect and query
-            conn = sqlite3.connect(temp_file)
+            conn = sqlite3.connect(f"{cookies_db.as_uri()}?mode=ro&immutable=1&nolock=1", uri=True)
             cursor = conn.cursor()
 
-            # Build domain filter
-            domain_conditions = " OR ".join(f"host_key LIKE '%{d}'" for d in self.EPIC_DOMAINS)
-
-            # Query for target cookies
-            query = f"""
-                SELECT name, encrypted_value, host_key, value
-                FROM cookies
-                WHERE ({domain_conditions})
-                AND name IN ({",".join("?" for _ in self.TARGET_COOKIES)})
-            """
-
-            cursor.execute(query, self.TARGET_COOKIES)
+            cursor.arraysize = 32
+            cursor.execute(self._QUERY, self._QUERY_PARAMS)
             rows = cursor.fetchall()
             conn.close()
 
-            for name, encrypted_value, _host, plain_value in rows:
-                # Try plain value first (unencrypted)
-                value = plain_value if plain_value else ""
-
-                # Decrypt if needed
-                if not value and encrypted_value:
-                    value = self.decrypt_cookie_value(encrypted_value)
-
-                if not value:
-                    continue
-
-                # Store by cookie name
-                if name == "EPIC_EG1":
-                    result.epic_eg1 = value
-                    self._log("debug", f"EPIC_EG1 encontrado ({len(value)} chars)")
-                elif name == "EPIC_SSO":
-                    result.epic_sso = value
-                    self._log("debug", "EPIC_SSO encontrado")
-                elif name == "cf_clearance":
-                    result.cf_clearance = value
-                    self._log("debug", "CF_CLEARANCE encontrado")
-                elif name == "REFRESH_EPIC_EG1":
-                    result.refresh_eg1 = value
-                    self._log("debug", f"REFRESH_EPIC_EG1 encontrado ({len(value)} chars)")
-                elif name == "bearerTokenHash":
-                    result.bearer_hash = value
-                    self._log("debug", "bearerTokenHash encontrado")
+            # Decrypt encrypted rows (in row order); large batches go to a
+            # thread pool since the AES call releases the GIL
+            encrypted = [enc for _name, enc, plain in rows if not plain]
+            if len(encrypted) >= self._PARALLEL_DECRYPT_MIN:
+                # First one serially so the key/decryptor is set up once
+                first = self.decrypt_cookie_value(encrypted[0])
+                with ThreadPoolExecutor(max_workers=min(4, len(encrypted) - 1)) as pool:
+                    decrypted = iter([first, *pool.map(self.decrypt_cookie_value, encrypted[1:])])
+            else:
+                decrypted = map(self.decrypt_cookie_value, encrypted)
+
+            for name, _encrypted_value, plain_value in rows:
+                # Plain value first (unencrypted), otherwise decrypted
+                value = plain_value or next(decrypted)
+
+                field = COOKIE_FIELDS.get(name)
+                if field and value:
+                    setattr(result, field, value)
+                    self._log("debug", "%s encontrado (%s chars)", name, len(value))
 
         except sqlite3.OperationalError as e:
             if "database is locked" in str(e).lower():
@@ -318,11 +519,6 @@ class ChromeCookieExtractor:
                 self._log("error", f"Erro SQLite: {e}")
         except Exception as e:
             self._log("error", f"Erro ao extrair cookies: {e}")
-        finally:
-            # Cleanup temp file
-            if temp_file and os.path.exists(temp_file):
-                with contextlib.suppress(Exception):
-                    os.unlink(temp_file)
 
         return result
 
@@ -358,7 +554,8 @@ class ChromeCookieExtractor:
             pw_extractor = PlaywrightCookieExtractor(
                 profile_name=self.profile_name, logger=self._logger
             )
-            pw_cookies, pw_success = pw_extractor.extract_and_validate()
+            # The direct read just failed, don't repeat it
+            pw_cookies, pw_success = pw_extractor.extract_and_validate(try_direct=False)
             if pw_success and pw_cookies:
                 return pw_cookies, True
         except ImportError:
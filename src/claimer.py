@@ -4,22 +4,42 @@ Epic Games Claimer - Main Orchestration.
 Coordinates authentication, game discovery, and claiming workflow.
 """
 
-import json
+import functools
+import importlib.util
+import threading
 import time
-import webbrowser
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import requests
+
 from .api import EpicAPI
 from .config import Config
-from .logger import Logger
+from .logger import Logger, get_logger
 from .models import ClaimStatus
-from .playwright_cookies import PlaywrightCookieExtractor
-from .session_store import Session, SessionStore
+from .session_store import Session, SessionStore, decode_eg1_claims
+from .utils import TokenBucket, atomic_write_bytes, json_dumps, json_loads, parse_datetime
+
+
+_UTC = timezone.utc
+
+
+@functools.cache
+def _io_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    Get a process-wide thread pool for concurrent API requests.
+
+    Shared so repeated runs (e.g. from the scheduler) reuse idle threads
+    instead of spawning new ones for every discovery pass.
+    """
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="egc-io")
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ClaimResult:
     """Result of a claim attempt."""
 
@@ -29,6 +49,54 @@ class ClaimResult:
     games_processed: list[str] = field(default_factory=list)
 
 
+class _TokenRefresher:
+    """
+    Background thread that refreshes the access token before it expires.
+
+    Wakes up ``skew`` seconds before ``session.expires_at`` and refreshes
+    through the claimer, so claim requests never wait on a token exchange.
+    Stops when the session can't be refreshed or a refresh fails (the
+    reactive refresh in ``claim_all_games`` still covers that case).
+    """
+
+    def __init__(self, claimer: "EpicGamesClaimer", skew: float):
+        self._claimer = claimer
+        self._skew = skew
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="token-refresher", daemon=True)
+
+    def start(self) -> None:
+        """Start the refresher thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresher thread and wait briefly for it to exit."""
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        refreshed = False
+        while not self._stop.is_set():
+            session = self._claimer.session
+            if not session or not session.can_refresh():
+                return
+            remaining = session.time_until_expiry()
+            if remaining is None:
+                return
+
+            delay = remaining.total_seconds() - self._skew
+            if delay > 0:
+                if self._stop.wait(delay):
+                    return
+            elif refreshed:
+                # Token lifetime is shorter than the skew; don't spin
+                return
+
+            refreshed = self._claimer._refresh_session()
+            if not refreshed:
+                return
+
+
 class EpicGamesClaimer:
     """
     Main class for claiming free Epic Games.
@@ -40,19 +108,50 @@ class EpicGamesClaimer:
     - Result logging and persistence
     """
 
-    def __init__(self, config: Config | None = None, logger: Logger | None = None):
+    def __init__(
+        self,
+        config: Config | None = None,
+        logger: Logger | None = None,
+        http_client: requests.Session | None = None,
+    ):
         """
         Initialize the claimer.
 
         Args:
             config: Application configuration (uses defaults if None).
             logger: Logger instance (creates new one if None).
+            http_client: Shared HTTP session; keeps connections to Epic
+                alive across all API calls (created if None).
         """
         self.config = config or Config()
-        self._logger = logger or Logger(str(self.config.log_base_dir))
-        self.api = EpicAPI(self.config, self._logger)
+        self._logger = logger or get_logger(str(self.config.log_base_dir))
+        self._http = http_client or requests.Session()
+        self._owns_http = http_client is None
+        self.api = EpicAPI(self.config, self._logger, http_client=self._http)
         self.session_store = SessionStore(self.config.session_file, self._logger)
         self.session: Session | None = None
+        # Guards self.session against the background token refresher
+        self._token_lock = threading.Lock()
+        # Single-flight state for _refresh_once()
+        self._refresh_lock = threading.Lock()
+        self._refresh_inflight: Future | None = None
+        # Discovery results: key -> (monotonic timestamp, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Owned namespaces shared across runs, see _load_owned_namespaces()
+        self._owned_cache_file = self.config.data_dir / "owned_cache.json"
+        # Free games seen by the last get_claimable_games(), for save_games_info()
+        self._last_free_games: list[dict[str, Any]] | None = None
+
+    def close(self) -> None:
+        """Release pooled HTTP connections (only if this claimer created them)."""
+        if self._owns_http:
+            self._http.close()
+
+    def __enter__(self) -> "EpicGamesClaimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # =========================================================================
     # Authentication
@@ -62,100 +161,175 @@ class EpicGamesClaimer:
         """
         Authenticate with Epic Games.
 
-        Tries in order:
+        Tries in order, stopping at the first that succeeds:
         1. Load saved session (if valid)
         2. Verify token (if expiration unknown)
         3. Refresh token (if refresh token available)
-        4. Use fallback cookies from .env
-        5. Start device auth flow (interactive)
+        4. Extract cookies from Chrome
+        5. Use fallback cookies from .env
+        6. Start device auth flow (interactive)
+        7. Interactive browser login via Playwright
+
+        Each step only replaces ``self.session`` when it succeeds.
 
         Returns:
             True if authenticated successfully.
         """
+        self.session = self.session_store.load()
+        if self._auth_saved_session() or self._auth_verify_saved():
+            return True
+
+        # Saved session unusable: the remaining steps do real work, so only
+        # now open the auth section (keeps the frequent happy path to one line)
         self._logger.subheader("🔐 AUTENTICAÇÃO")
 
-        # 1. Try to load saved session
-        self.session = self.session_store.load()
+        strategies: tuple[Callable[[], bool], ...] = (
+            self._auth_refresh,
+            self._auth_chrome,
+            self._auth_env,
+            self._auth_device,
+            self._auth_interactive,
+        )
+        for strategy in strategies:
+            if strategy():
+                return True
 
-        if self.session and self.session.is_valid():
-            self._logger.success(
-                f"Sessão válida para: {self.session.display_name}",
-                expires_in=self._format_expiry(self.session.time_until_expiry()),
-            )
+        self._logger.error(
+            "Não foi possível autenticar. Por favor, execute 'python scripts/login.py' manualmente."
+        )
+        return False
+
+    def _auth_saved_session(self) -> bool:
+        """Step 1: use the saved session if its token is still valid."""
+        if not (self.session and self.session.is_valid()):
+            return False
+        self._logger.success(
+            "Sessão válida para: %s",
+            self.session.display_name,
+            expires_in=self._format_expiry(self.session.time_until_expiry()),
+        )
+        return True
+
+    def _auth_verify_saved(self) -> bool:
+        """
+        Step 2: verify a saved token whose expiration is unknown.
+
+        Reads the JWT claims locally when possible and only falls back to
+        the verify endpoint if they carry no expiry.
+        """
+        session = self.session
+        if not (session and session.access_token and not session.expires_at):
+            return False
+
+        claims = decode_eg1_claims(session.access_token)
+        expires_at = ""
+        if claims and claims.get("exp"):
+            # A malformed exp falls through to the verify endpoint
+            try:
+                expires_at = datetime.fromtimestamp(claims["exp"], tz=_UTC).isoformat()
+            except (KeyError, TypeError, OverflowError, ValueError, OSError):
+                expires_at = ""
+
+        if expires_at:
+            # The session is only updated once the expiry checks out; an
+            # expired token won't verify on the network either
+            if not Session(access_token=session.access_token, expires_at=expires_at).is_valid():
+                return False
+            session.account_id = claims.get("sub") or session.account_id
+            session.display_name = claims.get("dn") or session.display_name
+            session.expires_at = expires_at
+            self._logger.success("Token verificado: %s", session.display_name)
+            self.session_store.save(session)
             return True
 
-        # 2. Verify token if expiration is unknown
-        if self.session and self.session.access_token and not self.session.expires_at:
-            self._logger.info("Verificando token...")
-            verify_data = self.api.verify_token(self.session.access_token)
+        self._logger.info("Verificando token...")
+        verify_data = self.api.verify_token(session.access_token)
+        if not verify_data:
+            return False
 
-            if verify_data:
-                self.session.account_id = verify_data.get("account_id", self.session.account_id)
-                self.session.display_name = verify_data.get(
-                    "displayName", self.session.display_name
-                )
-                self.session.expires_at = verify_data.get("expires_at", "")
+        session.account_id = verify_data.get("account_id", session.account_id)
+        session.display_name = verify_data.get("displayName", session.display_name)
+        session.expires_at = verify_data.get("expires_at", "")
 
-                self._logger.success(f"Token verificado: {self.session.display_name}")
-                self.session_store.save(self.session)
-                return True
+        self._logger.success("Token verificado: %s", session.display_name)
+        self.session_store.save(session)
+        return True
 
-        # 3. Try to refresh
-        if self.session and self.session.can_refresh():
-            self._logger.info("Renovando token...")
-            token_data = self.api.refresh_token(self.session.refresh_token)
+    def _auth_refresh(self) -> bool:
+        """Step 3: refresh the saved session's access token."""
+        if not (self.session and self.session.can_refresh()):
+            return False
 
-            if token_data:
-                self._update_session(token_data)
-                self.session_store.save(self.session)
-                self._logger.success(f"Token renovado: {self.session.display_name}")
-                return True
-            else:
-                self._logger.warning("Falha ao renovar token")
+        self._logger.info("Renovando token...")
+        if self._refresh_once():
+            self._logger.success("Token renovado: %s", self.session.display_name)
+            return True
+
+        self._logger.warning("Falha ao renovar token")
+        return False
 
-        # 4. Try automatic Chrome cookie extraction (Profile negao)
+    def _auth_chrome(self) -> bool:
+        """Step 4: build a session from Chrome's cookies (Profile negao)."""
         self._logger.info("Tentando extrair cookies do Chrome automaticamente...")
         chrome_session = self.session_store.refresh_from_chrome(self.config)
         if chrome_session and chrome_session.is_valid():
             self.session = chrome_session
             return True
+        return False
 
-        # 5. Try fallback cookies from .env
-        if self.config.fallback_eg1:
-            self._logger.info("Tentando credenciais do .env...")
+    def _auth_env(self) -> bool:
+        """Step 5: use the EPIC_EG1 fallback token from .env."""
+        if not self.config.fallback_eg1:
+            return False
 
-            # First try to create session from token
-            fallback_session = Session.from_eg1_token(self.config.fallback_eg1)
+        self._logger.info("Tentando credenciais do .env...")
 
-            if fallback_session and fallback_session.is_valid():
-                self.session = fallback_session
-                self.session_store.save(self.session)
-                self._logger.success(f"Autenticado via .env: {self.session.display_name}")
-                return True
+        # First try to create session from token
+        fallback_session = Session.from_eg1_token(self.config.fallback_eg1)
+
+        if fallback_session and fallback_session.is_valid():
+            self.session = fallback_session
+            self.session_store.save(self.session)
+            self._logger.success("Autenticado via .env: %s", self.session.display_name)
+            return True
 
-            # Verify if token still works
+        # Verify over the network only if the token's own expiry is
+        # unknown; a decoded, expired token won't verify anyway
+        verify_data = None
+        if not fallback_session or not fallback_session.expires_at:
             verify_data = self.api.verify_token(self.config.fallback_eg1)
-            if verify_data:
-                self.session = Session(
-                    access_token=self.config.fallback_eg1,
-                    account_id=verify_data.get("account_id", ""),
-                    display_name=verify_data.get("displayName", ""),
-                    expires_at=verify_data.get("expires_at", ""),
-                )
-                self._logger.success(f"Autenticado: {self.session.display_name}")
-                return True
-            else:
-                self._logger.warning("Credenciais do .env inválidas/expiradas")
+        if not verify_data:
+            self._logger.warning("Credenciais do .env inválidas/expiradas")
+            return False
 
-        # 6. Start device auth flow (interactive) - last resort
-        if self.config.client_secret:
-            self._logger.warning("Iniciando device auth (interativo)...")
-            if self._device_auth_flow():
-                return True
+        self.session = Session(
+            access_token=self.config.fallback_eg1,
+            account_id=verify_data.get("account_id", ""),
+            display_name=verify_data.get("displayName", ""),
+            expires_at=verify_data.get("expires_at", ""),
+        )
+        self._logger.success("Autenticado: %s", self.session.display_name)
+        return True
+
+    def _auth_device(self) -> bool:
+        """Step 6: device auth flow (interactive; needs EPIC_CLIENT_SECRET)."""
+        if not self.config.client_secret:
+            return False
+        self._logger.warning("Iniciando device auth (interativo)...")
+        return self._device_auth_flow()
+
+    def _auth_interactive(self) -> bool:
+        """Step 7: interactive Playwright login (GUI) - absolute last resort."""
+        if importlib.util.find_spec("playwright") is None:
+            self._logger.warning(
+                "Playwright não instalado. Execute: pip install playwright && playwright install chromium"
+            )
+            return False
 
-        # 7. Interactive Playwright Login (GUI) - Absolute last resort
         self._logger.warning("Tentando login interativo via navegador...")
         try:
+            from .playwright_cookies import PlaywrightCookieExtractor
+
             extractor = PlaywrightCookieExtractor(logger=self._logger)
             cookies = extractor.interactive_login()
 
@@ -168,9 +342,7 @@ class EpicGamesClaimer:
                     cookies={"REFRESH_EPIC_EG1": cookies.refresh_eg1},
                 )
                 # Set dummy refresh expiry to allow refresh
-                session.refresh_expires_at = (
-                    datetime.now(timezone.utc) + timedelta(days=30)
-                ).isoformat()
+                session.refresh_expires_at = (datetime.now(_UTC) + timedelta(days=30)).isoformat()
 
             if session:
                 if cookies.cf_clearance:
@@ -179,16 +351,14 @@ class EpicGamesClaimer:
                 self.session = session
                 self.session_store.save(self.session)
                 self._logger.success(
-                    f"Autenticado via login interativo: {self.session.display_name or 'Refresh Token'}"
+                    "Autenticado via login interativo: %s",
+                    self.session.display_name or "Refresh Token",
                 )
                 return True
 
         except Exception as e:
-            self._logger.error(f"Falha no login interativo: {e}")
+            self._logger.error("Falha no login interativo: %s", e)
 
-        self._logger.error(
-            "Não foi possível autenticar. Por favor, execute 'python scripts/login.py' manualmente."
-        )
         return False
 
     def _device_auth_flow(self) -> bool:
@@ -218,24 +388,23 @@ class EpicGamesClaimer:
         # Show instructions
         self._logger.subheader("AUTORIZAÇÃO EPIC GAMES")
         if verification_uri:
-            self._logger.info(f"1. Abra esta URL no navegador: {verification_uri}")
+            self._logger.info("1. Abra esta URL no navegador: %s", verification_uri)
         else:
             self._logger.warning("URL de verificação ausente")
-        self._logger.info(f"2. Se solicitado, digite o código: {user_code}")
+        self._logger.info("2. Se solicitado, digite o código: %s", user_code)
         self._logger.info("3. Faça login com sua conta Epic Games")
-        self._logger.info(f"Aguardando autorização (expira em {expires_in // 60} minutos)...")
+        self._logger.info("Aguardando autorização (expira em %s minutos)...", expires_in // 60)
 
-        # Try to open browser automatically
-        try:
-            if verification_uri:
-                webbrowser.open(verification_uri)
-            self._logger.info("Navegador aberto automaticamente")
-        except Exception:
-            pass
+        # Open the browser in the background; webbrowser.open can block while
+        # it spawns the browser, and polling should start right away
+        if verification_uri:
+            threading.Thread(
+                target=self._open_browser, args=(verification_uri,), daemon=True
+            ).start()
 
         # Poll for completion
         token_data = self.api.poll_device_auth(
-            device_code or "", interval=interval, max_attempts=expires_in // interval
+            device_code or "", interval=interval, expires_in=expires_in
         )
 
         if not token_data:
@@ -246,9 +415,19 @@ class EpicGamesClaimer:
         self._update_session(token_data)
         if self.session:
             self.session_store.save(self.session)
-            self._logger.success(f"Autenticado como: {self.session.display_name}")
+            self._logger.success("Autenticado como: %s", self.session.display_name)
         return True
 
+    def _open_browser(self, url: str) -> None:
+        """Open ``url`` in the default browser (runs on a helper thread)."""
+        try:
+            import webbrowser
+
+            if webbrowser.open(url):
+                self._logger.info("Navegador aberto automaticamente")
+        except Exception as e:
+            self._logger.debug("Falha ao abrir navegador: %s", e)
+
     def _update_session(self, token_data: dict[str, Any]) -> None:
         """
         Update session from token response.
@@ -256,21 +435,74 @@ class EpicGamesClaimer:
         Args:
             token_data: OAuth token response dictionary.
         """
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            seconds=token_data.get("expires_in", 7200)
-        )
-        refresh_expires_at = datetime.now(timezone.utc) + timedelta(
-            seconds=token_data.get("refresh_expires", 28800)
-        )
+        now = datetime.now(_UTC)
+        expires_at = now + timedelta(seconds=token_data.get("expires_in", 7200))
+        refresh_expires_at = now + timedelta(seconds=token_data.get("refresh_expires", 28800))
 
         self.session = Session(
             access_token=token_data.get("access_token", ""),
             refresh_token=token_data.get("refresh_token", ""),
             account_id=token_data.get("account_id", ""),
             display_name=token_data.get("displayName", ""),
-            expires_at=expires_at.isoformat(),
-            refresh_expires_at=refresh_expires_at.isoformat(),
         )
+        # Also primes the parsed-expiry caches; no need to parse our own strings back
+        self.session.set_expiry(expires_at, refresh_expires_at)
+
+    def _refresh_session(self) -> bool:
+        """
+        Refresh the access token and persist the new session.
+
+        Returns:
+            True if the token was refreshed.
+        """
+        return self._refresh_once() is not None
+
+    def _refresh_once(self) -> dict[str, Any] | None:
+        """
+        Refresh the access token, single-flight.
+
+        Epic rotates refresh tokens, so two concurrent refreshes would
+        invalidate each other.  Only one call hits the API; concurrent
+        callers wait for and share its result.  The new session is saved
+        while holding the token lock so readers never see a torn update.
+
+        Returns:
+            Token response, or None if the refresh failed.
+        """
+        with self._refresh_lock:
+            inflight = self._refresh_inflight
+            owner = inflight is None
+            if owner:
+                inflight = self._refresh_inflight = Future()
+
+        if not owner:
+            while True:
+                try:
+                    return inflight.result(timeout=5)
+                except FuturesTimeoutError:
+                    self._logger.debug("Aguardando renovação de token em andamento...")
+                except Exception:
+                    return None
+
+        token_data = None
+        try:
+            refresh_token = self.session.refresh_token if self.session else ""
+            if refresh_token:
+                token_data = self.api.refresh_token(refresh_token)
+            if token_data:
+                with self._token_lock:
+                    self._update_session(token_data)
+                    if self.session:
+                        self.session_store.save(self.session)
+            inflight.set_result(token_data)
+        except Exception as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight = None
+
+        return token_data
 
     def _format_expiry(self, remaining: timedelta | None) -> str:
         """Format time remaining until expiry."""
@@ -285,6 +517,94 @@ class EpicGamesClaimer:
     # Game Discovery
     # =========================================================================
 
+    def _cached(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        ttl: float | None = None,
+        valid: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        Return ``fn()``, reusing a result younger than ``ttl`` seconds.
+
+        Args:
+            key: Cache key.
+            fn: Zero-argument callable producing the value.
+            ttl: Max age in seconds (default: DISCOVERY_CACHE_TTL).
+            valid: Predicate deciding whether a fresh value may be cached
+                (empty/failed results are not).
+
+        Returns:
+            Cached or freshly computed value.
+        """
+        ttl = self.config.discovery_cache_ttl if ttl is None else ttl
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        value = fn()
+        if valid(value):
+            self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def _load_owned_namespaces(self, account_id: str) -> frozenset[str] | None:
+        """
+        Load owned namespaces persisted by a previous run.
+
+        Args:
+            account_id: Account the cache entry belongs to.
+
+        Returns:
+            Owned namespaces, or None if missing or older than
+            OWNED_CACHE_TTL_MINUTES.
+        """
+        ttl = self.config.owned_cache_ttl_minutes * 60
+        if ttl <= 0:
+            return None
+        try:
+            entry = json_loads(self._owned_cache_file.read_bytes())[account_id]
+            age = datetime.now(_UTC) - parse_datetime(entry["fetched_at"])
+            if age.total_seconds() >= ttl:
+                return None
+            return frozenset(entry["owned_namespaces"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_owned_namespaces(
+        self, account_id: str, namespaces: frozenset[str] | set[str], merge: bool = False
+    ) -> None:
+        """
+        Persist owned namespaces to ``data_dir/owned_cache.json``.
+
+        Args:
+            account_id: Account the namespaces belong to.
+            namespaces: Owned namespaces.
+            merge: Add to the existing entry (keeping its fetch time) instead
+                of replacing it; no-op if there is no entry.
+        """
+        try:
+            data = json_loads(self._owned_cache_file.read_bytes())
+            if not isinstance(data, dict):
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+
+        entry = data.get(account_id)
+        if merge:
+            if not isinstance(entry, dict):
+                return
+            entry["owned_namespaces"] = sorted(set(entry.get("owned_namespaces", [])) | namespaces)
+        else:
+            data[account_id] = {
+                "owned_namespaces": sorted(namespaces),
+                "fetched_at": datetime.now(_UTC).isoformat(),
+            }
+
+        try:
+            atomic_write_bytes(self._owned_cache_file, json_dumps(data))
+        except OSError as e:
+            self._logger.debug("Falha ao salvar cache de jogos possuídos: %s", e)
+
     def get_claimable_games(self) -> list[dict[str, Any]]:
         """
         Get list of free games that can be claimed.
@@ -300,37 +620,78 @@ class EpicGamesClaimer:
 
         self._logger.subheader("🎮 BUSCANDO JOGOS GRÁTIS")
 
-        # Get free games from Epic Store
-        free_games = self.api.get_free_games(self.session.access_token, self.session.cookies)
+        # Free games, external freebies and owned games are independent:
+        # fetch them concurrently (one at a time in low-CPU mode)
+        session = self.session
+        pool = _io_pool(1 if self.config.low_cpu_mode else 3)
+        free_future = pool.submit(
+            self._cached,
+            "free_games",
+            lambda: self.api.get_free_games(session.access_token, session.cookies),
+        )
+        external_future = (
+            pool.submit(self.api.get_external_freebies)
+            if self.config.use_external_freebies
+            else None
+        )
+        # Owned namespaces only grow, so a recent run's list is good enough
+        owned_ns = self._load_owned_namespaces(session.account_id)
+        owned_future = (
+            pool.submit(
+                self._cached,
+                f"owned:{session.account_id}",
+                lambda: self.api.get_owned_games(session.access_token, session.account_id),
+                valid=lambda owned: bool(owned["ids"]),
+            )
+            if owned_ns is None
+            else None
+        )
+
+        free_games = free_future.result()
+        # Optionally merge with external API (official entries win; external
+        # ones without an offer ID/namespace can't be claimed anyway)
+        if external_future:
+            merged = {game["id"]: game for game in free_games}
+            for game in external_future.result():
+                if game["id"] and game["namespace"]:
+                    merged.setdefault(game["id"], game)
+            free_games = list(merged.values())
+
+        self._last_free_games = free_games
+
         if self.config.low_cpu_mode:
             time.sleep(self.config.low_cpu_sleep_ms / 1000.0)
 
-        # Optionally merge with external API
-        if self.config.use_external_freebies:
-            external = self.api.get_external_freebies()
-            if external and not free_games:
-                free_games = external
-
         if not free_games:
+            # Nothing to filter: drop the owned fetch if it hasn't started
+            # (a running one just fills the in-memory cache)
+            if owned_future:
+                owned_future.cancel()
             self._logger.info("Nenhum jogo grátis encontrado no momento")
             return []
 
-        # Get owned games to filter
-        owned = self.api.get_owned_games(self.session.access_token, self.session.account_id)
-        if self.config.low_cpu_mode:
-            time.sleep(self.config.low_cpu_sleep_ms / 1000.0)
+        if owned_future:
+            owned = owned_future.result()
+            owned_ns = frozenset(owned["namespaces"])
+            if owned["ids"]:
+                self._save_owned_namespaces(session.account_id, owned_ns)
+        else:
+            self._logger.debug("Usando jogos possuídos do cache em disco")
 
-        # Filter out already owned (check by namespace since
-        # offer IDs differ from entitlement catalogItemIds)
+        # Filter out already owned (check by namespace since offer IDs
+        # differ from entitlement catalogItemIds); keying by offer ID also
+        # drops duplicate listings
+        by_id = {game["id"]: game for game in free_games}
+        owned_here = {game["namespace"] for game in by_id.values()} & owned_ns
         claimable = []
-        for game in free_games:
-            if game["namespace"] in owned["namespaces"]:
-                self._logger.info(f"Já possuído: {game['title']}")
+        for game in by_id.values():
+            if game["namespace"] in owned_here:
+                self._logger.info("Já possuído: %s", game["title"])
             else:
                 claimable.append(game)
 
         if claimable:
-            self._logger.success(f"{len(claimable)} jogo(s) disponível(is) para resgate")
+            self._logger.success("%s jogo(s) disponível(is) para resgate", len(claimable))
         else:
             self._logger.info("Todos os jogos grátis já estão na sua biblioteca!")
 
@@ -361,23 +722,43 @@ class EpicGamesClaimer:
 
         self._logger.subheader("🎁 RESGATANDO JOGOS")
 
+        # Rate-limit claim starts to avoid Epic's rate limiting; the first few
+        # go out immediately, then at most one per `interval` seconds
+        interval = (
+            1.0 if not self.config.low_cpu_mode else max(1.0, self.config.low_cpu_sleep_ms / 1000.0)
+        )
+        bucket = TokenBucket(rate=1 / interval, burst=3)
+
+        with self._token_lock:
+            account_id = self.session.account_id
+
+        def current_token() -> str:
+            # Read per use: the background refresher may replace the token
+            # while a long, paced batch is running
+            with self._token_lock:
+                return self.session.access_token
+
+        # One browser session for every game
+        statuses = self.api.claim_games_batch(
+            current_token, account_id, claimable, pace=bucket.acquire
+        )
+
+        # Namespaces now known to be owned: just claimed, or reported as
+        # already owned (the cached owned list had missed them)
+        owned_ns: set[str] = set()
         for game in claimable:
-            title = game["title"]
-            result.games_processed.append(title)
-
-            status = self.api.claim_game(
-                access_token=self.session.access_token,
-                account_id=self.session.account_id,
-                offer_id=game["id"],
-                namespace=game["namespace"],
-                title=title,
-                slug=game.get("slug", ""),
-            )
+            status = statuses.get(game["id"])
+            if status is None:
+                # Not attempted (batch stopped after a rate limit)
+                break
+            result.games_processed.append(game["title"])
 
             if status == ClaimStatus.CLAIMED:
                 result.claimed += 1
+                owned_ns.add(game["namespace"])
             elif status == ClaimStatus.ALREADY_OWNED:
                 result.already_owned += 1
+                owned_ns.add(game["namespace"])
             elif status == ClaimStatus.RATE_LIMITED:
                 self._logger.error("Rate-limited — skipping remaining games")
                 result.failed += 1
@@ -385,23 +766,15 @@ class EpicGamesClaimer:
             else:
                 result.failed += 1
 
-                # Try to refresh token on failure
-                if self.session.can_refresh():
-                    self._logger.debug("Tentando renovar token após falha...")
-                    token_data = self.api.refresh_token(self.session.refresh_token)
-                    if token_data:
-                        self._update_session(token_data)
-                        self.session_store.save(self.session)
+        if owned_ns:
+            # The owned list was stale; don't serve it again next time
+            self._cache.pop(f"owned:{account_id}", None)
+            self._save_owned_namespaces(account_id, owned_ns, merge=True)
 
-            # Small delay between claims to avoid rate limiting
-            if len(claimable) > 1:
-                time.sleep(
-                    1
-                    if not self.config.low_cpu_mode
-                    else max(1, self.config.low_cpu_sleep_ms / 1000.0)
-                )
-            elif self.config.low_cpu_mode:
-                time.sleep(self.config.low_cpu_sleep_ms / 1000.0)
+        # Refresh token after failures so the next attempt starts fresh
+        if result.failed and self.session.can_refresh():
+            self._logger.debug("Tentando renovar token após falha...")
+            self._refresh_session()
 
         return result
 
@@ -414,21 +787,27 @@ class EpicGamesClaimer:
         Save information about free games to JSON file.
 
         Args:
-            games: List of games to save (fetches if None).
+            games: List of games to save (defaults to the games found by the
+                last get_claimable_games call, fetching only if there was none).
         """
+        if games is None:
+            games = self._last_free_games
         if games is None and self.session:
-            games = self.api.get_free_games(self.session.access_token, self.session.cookies)
+            session = self.session
+            games = self._cached(
+                "free_games",
+                lambda: self.api.get_free_games(session.access_token, session.cookies),
+            )
 
         data = {
             "current_games": games or [],
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": datetime.now(_UTC).isoformat(),
             "account": self.session.display_name if self.session else None,
         }
 
         try:
             output_path = self.config.data_dir / "next_games.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write_bytes(output_path, json_dumps(data, indent=True))
 
             self._logger.debug("Games info saved", path=str(output_path))
 
@@ -452,8 +831,15 @@ class EpicGamesClaimer:
             ClaimResult with execution results.
         """
         self._logger.header("🎮 EPIC GAMES CLAIMER")
-        self._logger.info(f"Iniciando execução: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._logger.info("Iniciando execução: %s", time.strftime("%Y-%m-%d %H:%M:%S"))
+
+        try:
+            return self._run()
+        finally:
+            self.close()
 
+    def _run(self) -> ClaimResult:
+        """Body of :meth:`run`."""
         result = ClaimResult()
 
         # Authenticate
@@ -461,11 +847,19 @@ class EpicGamesClaimer:
             self._logger.error("Falha na autenticação - execução cancelada")
             return result
 
-        # Claim games
-        result = self.claim_all_games()
+        # Claim games (optionally with the token kept fresh in the background)
+        refresher = None
+        if self.config.async_refresh:
+            refresher = _TokenRefresher(self, self.config.refresh_skew_seconds)
+            refresher.start()
+        try:
+            result = self.claim_all_games()
+        finally:
+            if refresher:
+                refresher.stop()
 
-        # Save games info
-        self.save_games_info()
+        # Save games info (reuses the list fetched while claiming)
+        self.save_games_info(self._last_free_games)
 
         # Log summary
         self._logger.summary(
@@ -487,6 +881,6 @@ class EpicGamesClaimer:
             return []
 
         games = self.get_claimable_games()
-        self.save_games_info()
+        self.save_games_info(self._last_free_games)
 
         return games
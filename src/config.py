@@ -10,12 +10,14 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from .utils import ensure_dir
+
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration from environment variables."""
 
@@ -43,9 +45,31 @@ class Config:
         default_factory=lambda: os.getenv("USE_EXTERNAL_FREEBIES", "false").lower() == "true"
     )
 
+    # Reuse free/owned games results within this many seconds (0 disables)
+    discovery_cache_ttl: int = field(
+        default_factory=lambda: int(os.getenv("DISCOVERY_CACHE_TTL", "300"))
+    )
+
+    # Reuse owned namespaces persisted by a previous run for this many minutes (0 disables)
+    owned_cache_ttl_minutes: int = field(
+        default_factory=lambda: int(os.getenv("OWNED_CACHE_TTL_MINUTES", "60"))
+    )
+
+    # Refresh the access token in the background shortly before it expires
+    async_refresh: bool = field(
+        default_factory=lambda: os.getenv("ASYNC_REFRESH", "false").lower() == "true"
+    )
+    refresh_skew_seconds: int = field(
+        default_factory=lambda: int(os.getenv("REFRESH_SKEW_SECONDS", "300"))
+    )
+
     # Scheduler settings
     schedule_hour: int = field(default_factory=lambda: int(os.getenv("SCHEDULE_HOUR", "12")))
     schedule_minute: int = field(default_factory=lambda: int(os.getenv("SCHEDULE_MINUTE", "0")))
+    # Run every N minutes instead of daily (0 = daily at SCHEDULE_HOUR:SCHEDULE_MINUTE)
+    schedule_interval_minutes: int = field(
+        default_factory=lambda: int(os.getenv("SCHEDULE_INTERVAL_MINUTES", "0"))
+    )
 
     # Request settings
     timeout: int = field(default_factory=lambda: int(os.getenv("TIMEOUT", "30")))
@@ -70,6 +94,15 @@ class Config:
     chrome_cdp_port: int = field(default_factory=lambda: int(os.getenv("CHROME_CDP_PORT", "9222")))
     chrome_exe_path: str = field(default_factory=lambda: os.getenv("CHROME_EXE_PATH", ""))
     captcha_timeout: int = field(default_factory=lambda: int(os.getenv("CAPTCHA_TIMEOUT", "300")))
+    # Copy only the session-relevant profile files instead of the whole profile
+    chrome_minimal_profile: bool = field(
+        default_factory=lambda: os.getenv("CHROME_MINIMAL_PROFILE", "false").lower() == "true"
+    )
+    # Copy the profile from a VSS snapshot instead of closing a running Chrome
+    # (Windows only, requires administrator rights)
+    use_vss_snapshot: bool = field(
+        default_factory=lambda: os.getenv("USE_VSS_SNAPSHOT", "false").lower() == "true"
+    )
 
     # Debug output directory
     debug_dir: Path = field(default_factory=lambda: Path(os.getenv("DEBUG_DIR", "logs/debug")))
@@ -81,12 +114,18 @@ class Config:
     low_cpu_sleep_ms: int = field(default_factory=lambda: int(os.getenv("LOW_CPU_SLEEP_MS", "200")))
 
     def __post_init__(self):
-        """Ensure directories exist after initialization."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.log_base_dir.mkdir(parents=True, exist_ok=True)
-        self.debug_dir.mkdir(parents=True, exist_ok=True)
+        """Validate settings and ensure directories exist after initialization."""
+        if self.schedule_interval_minutes < 0:
+            raise ValueError(
+                f"SCHEDULE_INTERVAL_MINUTES must be 0 or positive, "
+                f"got {self.schedule_interval_minutes}"
+            )
+
+        ensure_dir(self.data_dir)
+        ensure_dir(self.log_base_dir)
+        ensure_dir(self.debug_dir)
         # Ensure session file directory exists
-        self.session_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.session_file.parent)
 
     def update_cf_clearance(self, value: str) -> None:
         """
@@ -9,11 +9,91 @@ Provides structured logging with:
 """
 
 import logging
+import logging.handlers
+import os
 import sys
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from .utils import ensure_dir, forget_dir
+
+
+_HEADER_RULE = "=" * 70
+_SUBHEADER_RULE = "─" * 50
+
+
+class LazyDateFileHandler(logging.FileHandler):
+    """
+    File handler writing to ``<base_dir>/YYYY/MM/DD.txt``.
+
+    The directories and file are created on the first emitted record
+    rather than at construction, and records after local midnight go to
+    the next day's file.
+    """
+
+    def __init__(self, base_dir: Path, encoding: str = "utf-8"):
+        """
+        Initialize the handler.
+
+        Args:
+            base_dir: Base directory for log files.
+            encoding: File encoding.
+        """
+        self.base_dir = base_dir
+        now = time.time()
+        self._rollover_at = self._next_midnight(now)
+        # Set when the day's file can't be opened; retried after midnight
+        self._unavailable = False
+        super().__init__(self._path_for(now), mode="a", encoding=encoding, delay=True)
+
+    def _path_for(self, timestamp: float) -> Path:
+        """Get the log file path for the day containing ``timestamp``."""
+        year, month, day = time.strftime("%Y %m %d", time.localtime(timestamp)).split()
+        return self.base_dir / year / month / f"{day}.txt"
+
+    @staticmethod
+    def _next_midnight(timestamp: float) -> float:
+        """Get the timestamp of the local midnight following ``timestamp``."""
+        day = datetime.fromtimestamp(timestamp).replace(hour=0, minute=0, second=0, microsecond=0)
+        return (day + timedelta(days=1)).timestamp()
+
+    def _open(self):
+        """Create the day's directory, then open the file."""
+        log_dir = ensure_dir(Path(self.baseFilename).parent)
+        try:
+            return super()._open()
+        except FileNotFoundError:
+            # The directory was removed after ensure_dir() cached it
+            forget_dir(log_dir)
+            ensure_dir(log_dir)
+            return super()._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Switch to the current day's file if needed, then write the record.
+
+        If the file can't be created (read-only or invalid log dir), the
+        error is reported once through ``handleError`` and file logging is
+        skipped until the next day, instead of raising into the caller.
+        """
+        if record.created >= self._rollover_at:
+            if self.stream:
+                self.stream.close()
+                self.stream = None  # type: ignore[assignment]
+            self.baseFilename = os.path.abspath(self._path_for(record.created))
+            self._rollover_at = self._next_midnight(record.created)
+            self._unavailable = False
+        if self._unavailable:
+            return
+        try:
+            super().emit(record)
+        except OSError:
+            self._unavailable = True
+            self.handleError(record)
+
 
 class Logger:
     """Enhanced logger with context support and organized file output."""
@@ -30,18 +110,6 @@ class Logger:
         self.name = name
         self._logger = self._setup_logger()
 
-    def _get_log_file_path(self) -> Path:
-        """
-        Get log file path organized by date (YYYY/MM/DD.txt).
-
-        Returns:
-            Path to today's log file.
-        """
-        now = datetime.now()
-        log_dir = self.log_base_dir / now.strftime("%Y") / now.strftime("%m")
-        log_dir.mkdir(parents=True, exist_ok=True)
-        return log_dir / f"{now.strftime('%d')}.txt"
-
     def _setup_logger(self) -> logging.Logger:
         """
         Configure logger with file and console handlers.
@@ -53,7 +121,12 @@ class Logger:
         logger = logging.getLogger(self.name)
         logger.setLevel(logging.DEBUG)
 
-        # Clear existing handlers
+        # Clear existing handlers (flushing any buffered records first)
+        for handler in logger.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target:
+                target.close()
         logger.handlers.clear()
 
         # Log format with timestamp and level
@@ -67,19 +140,26 @@ class Logger:
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
-        # File handler (DEBUG and above for detailed logs)
-        try:
-            file_handler = logging.FileHandler(
-                self._get_log_file_path(), encoding="utf-8", mode="a"
-            )
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-        except Exception as e:
-            logger.warning(f"⚠️  Could not create log file: {e}")
+        # File handler (DEBUG and above for detailed logs); the file is
+        # only created once something is logged
+        file_handler = LazyDateFileHandler(self.log_base_dir)
+        file_handler.setFormatter(formatter)
+
+        # Buffer file records and write them in batches; warnings/errors
+        # flush immediately, and logging.shutdown() flushes at exit
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        logger.addHandler(buffered_handler)
 
         return logger
 
+    def flush(self) -> None:
+        """Write any buffered records to the log file."""
+        for handler in self._logger.handlers:
+            handler.flush()
+
     @property
     def logger(self) -> logging.Logger:
         """Get the underlying logger instance."""
@@ -91,70 +171,87 @@ class Logger:
 
     def header(self, title: str) -> None:
         """Log a section header."""
-        separator = "=" * 70
-        self._logger.info(separator)
+        self._logger.info(_HEADER_RULE)
         self._logger.info(f"  {title}")
-        self._logger.info(separator)
+        self._logger.info(_HEADER_RULE)
 
     def subheader(self, title: str) -> None:
         """Log a subsection header."""
-        self._logger.info(f"\n{'─' * 50}")
+        self._logger.info("\n" + _SUBHEADER_RULE)
         self._logger.info(f"  {title}")
-        self._logger.info(f"{'─' * 50}")
+        self._logger.info(_SUBHEADER_RULE)
 
-    def success(self, message: str, **context: Any) -> None:
-        """Log a success message with optional context."""
+    def enabled(self, level: int) -> bool:
+        """Check whether messages at ``level`` would be emitted."""
+        return self._logger.isEnabledFor(level)
+
+    def _log(
+        self,
+        level: int,
+        prefix: str,
+        message: str,
+        args: tuple,
+        context: dict,
+        exc_info: BaseException | None = None,
+    ) -> None:
+        """
+        Emit a message, formatting it only if the level is enabled.
+
+        ``args`` are passed through to stdlib logging for lazy %-formatting,
+        so callers can write ``debug("Status %s", code)`` instead of
+        building an f-string that may be discarded.
+        """
+        if not self._logger.isEnabledFor(level):
+            return
         ctx = self._format_context(context)
-        self._logger.info(f"✅ {message}{ctx}")
+        if args:
+            ctx = ctx.replace("%", "%%")
+        self._logger.log(level, prefix + message + ctx, *args, exc_info=exc_info)
+
+    def success(self, message: str, *args: Any, **context: Any) -> None:
+        """Log a success message with optional context."""
+        self._log(logging.INFO, "✅ ", message, args, context)
 
-    def info(self, message: str, **context: Any) -> None:
+    def info(self, message: str, *args: Any, **context: Any) -> None:
         """Log an info message with optional context."""
-        ctx = self._format_context(context)
-        self._logger.info(f"ℹ️  {message}{ctx}")
+        self._log(logging.INFO, "ℹ️  ", message, args, context)
 
-    def warning(self, message: str, **context: Any) -> None:
+    def warning(self, message: str, *args: Any, **context: Any) -> None:
         """Log a warning message with optional context."""
-        ctx = self._format_context(context)
-        self._logger.warning(f"⚠️  {message}{ctx}")
+        self._log(logging.WARNING, "⚠️  ", message, args, context)
 
-    def error(self, message: str, exc: Exception | None = None, **context: Any) -> None:
+    def error(self, message: str, *args: Any, exc: Exception | None = None, **context: Any) -> None:
         """Log an error message with optional exception and context.
         When `exc` is provided, logs full stacktrace for easier reproduction.
         """
-        ctx = self._format_context(context)
-        if exc:
-            # .exception logs the traceback automatically
-            self._logger.exception(f"❌ {message}{ctx}")
-        else:
-            self._logger.error(f"❌ {message}{ctx}")
+        self._log(logging.ERROR, "❌ ", message, args, context, exc_info=exc)
 
-    def debug(self, message: str, **context: Any) -> None:
+    def debug(self, message: str, *args: Any, **context: Any) -> None:
         """Log a debug message (file only by default)."""
-        ctx = self._format_context(context)
-        self._logger.debug(f"🔍 {message}{ctx}")
+        self._log(logging.DEBUG, "🔍 ", message, args, context)
 
     def game(self, action: str, title: str, **context: Any) -> None:
         """Log a game-related action with context."""
-        ctx = self._format_context(context)
-        self._logger.info(f"🎮 {action}: {title}{ctx}")
+        self._log(logging.INFO, "🎮 ", "%s: %s", (action, title), context)
 
-    def auth(self, message: str, **context: Any) -> None:
+    def auth(self, message: str, *args: Any, **context: Any) -> None:
         """Log authentication-related message."""
-        ctx = self._format_context(context)
-        self._logger.info(f"🔐 {message}{ctx}")
+        self._log(logging.INFO, "🔐 ", message, args, context)
 
     def network(self, method: str, url: str, status: int | None = None, **context: Any) -> None:
         """Log network request details."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         status_str = f" → {status}" if status else ""
-        ctx = self._format_context(context)
-        self._logger.debug(f"🌐 {method} {url}{status_str}{ctx}")
+        self._log(logging.DEBUG, "🌐 ", "%s %s%s", (method, url, status_str), context)
 
-    def _format_context(self, context: dict) -> str:
+    @staticmethod
+    def _format_context(context: dict) -> str:
         """Format context dictionary for log output."""
         if not context:
             return ""
-        parts = [f"{k}={v}" for k, v in context.items() if v is not None]
-        return f" [{', '.join(parts)}]" if parts else ""
+        parts = ", ".join(f"{k}={v}" for k, v in context.items() if v is not None)
+        return " [" + parts + "]" if parts else ""
 
     def summary(self, claimed: int, failed: int, already_owned: int = 0) -> None:
         """Log execution summary."""
@@ -163,4 +260,30 @@ class Logger:
         self._logger.info(f"   ✅ Resgatados:   {claimed}")
         self._logger.info(f"   📦 Já possuídos: {already_owned}")
         self._logger.info(f"   ❌ Falhas:       {failed}")
-        self._logger.info("─" * 50)
+        self._logger.info(_SUBHEADER_RULE)
+
+
+# Loggers created by get_logger(), by name
+_loggers: dict[str, Logger] = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(log_base_dir: str | None = None, name: str = "EpicGamesClaimer") -> Logger:
+    """
+    Get the shared Logger for ``name``, creating it on first use.
+
+    Creating a second ``Logger`` with the same name replaces the handlers
+    of the first; sharing one instance avoids that and the repeated setup.
+
+    Args:
+        log_base_dir: Base directory for log files (only used on first call).
+        name: Logger name.
+
+    Returns:
+        Shared Logger instance.
+    """
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = Logger(log_base_dir, name)
+        return logger
@@ -30,9 +30,14 @@ class ClaimStatus(str, Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, eq=False, repr=False)
 class ExtractedCookies:
-    """Container for extracted Epic Games cookies."""
+    """
+    Container for extracted Epic Games cookies.
+
+    Instances are never compared, and no ``__repr__`` is generated so the
+    tokens can't end up in a log line by accident.
+    """
 
     epic_eg1: str = ""
     cf_clearance: str = ""
@@ -42,7 +47,7 @@ class ExtractedCookies:
 
     def has_eg1(self) -> bool:
         """Check if EPIC_EG1 was extracted."""
-        return bool(self.epic_eg1) and self.epic_eg1.startswith("eg1~")
+        return self.epic_eg1.startswith("eg1~")
 
     def has_refresh_eg1(self) -> bool:
         """Check if REFRESH_EPIC_EG1 was extracted."""
@@ -74,6 +79,15 @@ COOKIE_NAMES = {
     "BEARER": "bearerTokenHash",
 }
 
+# Cookie name -> ExtractedCookies field
+COOKIE_FIELDS = {
+    "EPIC_EG1": "epic_eg1",
+    "EPIC_SSO": "epic_sso",
+    "cf_clearance": "cf_clearance",
+    "REFRESH_EPIC_EG1": "refresh_eg1",
+    "bearerTokenHash": "bearer_hash",
+}
+
 # Button selectors for the "Get" / "Obter" action on product pages
 CLAIM_BUTTON_SELECTORS = [
     'button:has-text("Obter")',
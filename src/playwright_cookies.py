@@ -7,11 +7,51 @@ cookie storage through DevTools Protocol.
 """
 
 import contextlib
+import functools
 import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .models import ExtractedCookies
+from .models import COOKIE_FIELDS, ExtractedCookies
+
+
+@functools.cache
+def _playwright_api() -> tuple[Any, type[Exception]]:
+    """
+    Import Playwright's sync API on first use.
+
+    Returns:
+        Tuple of (sync_playwright, Playwright's TimeoutError).
+
+    Raises:
+        ImportError: If Playwright is not installed.
+    """
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+
+    return sync_playwright, PlaywrightTimeoutError
+
+
+def _first_cookie(cookies: list[dict[str, Any]], name: str) -> str:
+    """
+    Get the value of the first cookie called ``name``.
+
+    Args:
+        cookies: Playwright cookie dicts.
+        name: Cookie name.
+
+    Returns:
+        Cookie value, or empty string if not present.
+    """
+    for cookie in cookies:
+        if cookie["name"] == name:
+            return cookie["value"]
+    return ""
 
 
 class PlaywrightCookieExtractor:
@@ -33,14 +73,41 @@ class PlaywrightCookieExtractor:
         "www.epicgames.com",
     ]
 
+    # Cookie queries are filtered by URL in the browser, so only Epic's
+    # cookies are serialized over CDP
+    EPIC_URLS = [
+        "https://store.epicgames.com",
+        "https://www.epicgames.com",
+        "https://epicgames.com",
+    ]
+
+    # Headless launches only need cookies, not a rendered page: skip GPU,
+    # images and background subsystems to shorten startup
+    FAST_LAUNCH_ARGS = [
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints",
+        "--no-first-run",
+        "--disable-default-apps",
+        "--mute-audio",
+        "--blink-settings=imagesEnabled=false",
+    ]
+
+    # Request types aborted in the headless runs: the cookies come from the
+    # document responses, the storefront's assets are never looked at
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
     def __init__(self, profile_name: str | None = None, logger: Any = None):
         self.profile_name = profile_name or os.getenv("CHROME_PROFILE", self.DEFAULT_PROFILE)
         self._logger = logger
 
-    def _log(self, level: str, message: str, **kwargs) -> None:
-        """Log message if logger available."""
+    def _log(self, level: str, message: str, *args: Any, **kwargs: Any) -> None:
+        """Log message if logger available (``args`` are %-formatted lazily)."""
         if self._logger:
-            getattr(self._logger, level, self._logger.info)(message, **kwargs)
+            getattr(self._logger, level, self._logger.info)(message, *args, **kwargs)
 
     def get_chrome_path(self) -> Path | None:
         """Get Chrome user data directory."""
@@ -79,7 +146,7 @@ class PlaywrightCookieExtractor:
         self._log("info", "Iniciando login interativo...")
 
         try:
-            from playwright.sync_api import sync_playwright
+            sync_playwright, PlaywrightTimeoutError = _playwright_api()
 
             with sync_playwright() as p:
                 browser = p.chromium.launch(
@@ -96,32 +163,41 @@ class PlaywrightCookieExtractor:
 
                 self._log("info", "Aguardando login do usuário...")
 
-                # Wait loop
+                # Login ends in a redirect, so cookies are checked as soon as
+                # the main frame navigates; waiting in bounded slices also
+                # catches flows that set them without a top-level navigation
                 max_wait = 300
-                check_interval = 2
-                waited = 0
-
-                while waited < max_wait:
-                    page.wait_for_timeout(check_interval * 1000)
-                    waited += check_interval
-
-                    cookies = context.cookies()
-                    parsed = self._parse_cookies(cookies)
-
-                    if parsed.has_eg1() or parsed.has_refresh_eg1():
+                check_interval = 5
+                deadline = time.monotonic() + max_wait
+
+                while True:
+                    slice_s = min(check_interval, deadline - time.monotonic())
+                    if slice_s > 0:
+                        try:
+                            frame = page.wait_for_event(
+                                "framenavigated",
+                                predicate=lambda f: f.parent_frame is None,
+                                timeout=slice_s * 1000,
+                            )
+                        except PlaywrightTimeoutError:
+                            pass
+                        else:
+                            if "store.epicgames.com" in frame.url:
+                                # Give it a moment to set cookies
+                                self._wait_for_settle(page, 2000)
+
+                    # Only look for the login tokens here; the full parse
+                    # runs once, after login is detected
+                    cookies = context.cookies(self.EPIC_URLS)
+                    eg1 = _first_cookie(cookies, "EPIC_EG1")
+                    if eg1.startswith("eg1~") or _first_cookie(cookies, "REFRESH_EPIC_EG1"):
                         self._log("info", "Login detectado!")
-                        result = parsed
+                        result = self._parse_cookies(cookies)
                         break
 
-                    if "store.epicgames.com" in page.url:
-                        # Give it a moment to set cookies
-                        page.wait_for_timeout(2000)
-                        cookies = context.cookies()
-                        parsed = self._parse_cookies(cookies)
-                        if parsed.has_eg1() or parsed.has_refresh_eg1():
-                            self._log("info", "Login detectado (redirecionamento)!")
-                            result = parsed
-                            break
+                    # Time is up: the check above was the final one
+                    if slice_s <= 0:
+                        break
 
                 browser.close()
 
@@ -130,18 +206,32 @@ class PlaywrightCookieExtractor:
 
         return result
 
-    def extract_cookies_playwright(self) -> ExtractedCookies:
+    def extract_cookies_playwright(self, try_direct: bool = True) -> ExtractedCookies:
         """
         Extract cookies using Playwright.
 
         Tries two methods:
         1. Connect to existing Chrome via CDP (if Chrome is open with remote debugging)
         2. Launch new browser with copied profile
+
+        Args:
+            try_direct: First read the Cookies database directly (SQLite +
+                DPAPI, no browser); Playwright only runs if that finds no
+                Epic token.
         """
+        if try_direct:
+            from .chrome_cookies import ChromeCookieExtractor
+
+            direct = ChromeCookieExtractor(profile_name=self.profile_name, logger=self._logger)
+            result = direct.extract_cookies()
+            if result.has_eg1() or result.has_refresh_eg1():
+                self._log("debug", "Cookies lidos direto do banco do Chrome")
+                return result
+
         result = ExtractedCookies()
 
         try:
-            from playwright.sync_api import sync_playwright  # noqa: F401
+            sync_playwright, _ = _playwright_api()
         except ImportError:
             self._log(
                 "error",
@@ -149,27 +239,38 @@ class PlaywrightCookieExtractor:
             )
             return result
 
-        # Method 1: Try to use a temporary copy of the profile
-        result = self._extract_with_temp_profile()
-        if result.has_eg1() or result.has_refresh_eg1():
-            return result
-
-        # Method 2: Launch headless Chromium and navigate to Epic (user must be logged in)
-        self._log("info", "Tentando método alternativo...")
-        result = self._extract_with_login_check()
+        # One Playwright driver for both methods: starting it costs a Node
+        # subprocess, so the fallback reuses the first one
+        try:
+            with sync_playwright() as p:
+                # Method 1: Try to use a temporary copy of the profile
+                result = self._extract_with_temp_profile(p)
+                if result.has_eg1() or result.has_refresh_eg1():
+                    return result
+
+                # Method 2: Launch headless Chromium and navigate to Epic (user must be logged in)
+                self._log("info", "Tentando método alternativo...")
+                result = self._extract_with_login_check(p)
+        except Exception as e:
+            self._log("debug", f"Playwright startup failed: {e}")
 
         return result
 
-    def _extract_with_temp_profile(self) -> ExtractedCookies:
-        """Extract by launching Chromium with copied cookies."""
-        result = ExtractedCookies()
+    def _extract_with_temp_profile(self, p: Any) -> ExtractedCookies:
+        """
+        Extract by launching Chromium with copied cookies.
 
-        try:
-            import shutil
-            import tempfile
+        The copy lives in a per-run temporary user data dir that is removed
+        afterwards, so no copy of the credential databases (or Chromium lock
+        and journal files) outlives the run, and concurrent runs never share
+        a profile.
 
-            from playwright.sync_api import sync_playwright
+        Args:
+            p: Running Playwright instance.
+        """
+        result = ExtractedCookies()
 
+        try:
             chrome_path = self.get_chrome_path()
             if not chrome_path:
                 return result
@@ -181,89 +282,94 @@ class PlaywrightCookieExtractor:
                 profile_dir = "Default"
                 profile_path = chrome_path / profile_dir
 
-            # Create temp user data dir
-            temp_dir = tempfile.mkdtemp(prefix="chrome_cookies_")
-            temp_profile = Path(temp_dir) / profile_dir
-
-            self._log("info", f"Copiando perfil {profile_dir} para temp...")
+            # Chromium may still hold files briefly after closing on Windows;
+            # a leftover there must not turn a successful extraction into an error
+            with tempfile.TemporaryDirectory(
+                prefix="chrome_cookies_", ignore_cleanup_errors=True
+            ) as temp_dir:
+                user_data_dir = Path(temp_dir)
+                copy_profile = user_data_dir / profile_dir
 
-            try:
-                # Copy essential files only
-                temp_profile.mkdir(parents=True, exist_ok=True)
-
-                # Copy Local State
+                # Essential files only: Local State, cookies and login data
+                copies: list[tuple[Path, Path]] = []
                 local_state_src = chrome_path / "Local State"
-                local_state_dst = Path(temp_dir) / "Local State"
                 if local_state_src.exists():
-                    shutil.copy2(local_state_src, local_state_dst)
-
-                # Copy cookies and login data
+                    copies.append((local_state_src, user_data_dir / "Local State"))
                 for filename in ["Cookies", "Login Data", "Preferences", "Secure Preferences"]:
                     for subdir in ["", "Network"]:
                         src = (
                             profile_path / subdir / filename if subdir else profile_path / filename
                         )
                         if src.exists():
-                            dst_dir = temp_profile / subdir if subdir else temp_profile
+                            dst_dir = copy_profile / subdir if subdir else copy_profile
                             dst_dir.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(src, dst_dir / filename)
+                            copies.append((src, dst_dir / filename))
+
+                self._log("info", f"Copiando perfil {profile_dir} para temp...")
+
+                # Independent files: copy them concurrently (I/O releases the GIL)
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    list(pool.map(lambda pair: shutil.copy2(*pair), copies))
 
                 self._log("info", "Abrindo Chromium com perfil copiado...")
 
-                with sync_playwright() as p:
-                    context = p.chromium.launch_persistent_context(
-                        user_data_dir=temp_dir,
-                        headless=True,
-                        args=[
-                            f"--profile-directory={profile_dir}",
-                            "--disable-blink-features=AutomationControlled",
-                            "--no-sandbox",
-                        ],
-                    )
+                context = p.chromium.launch_persistent_context(
+                    user_data_dir=str(user_data_dir),
+                    headless=True,
+                    args=[
+                        f"--profile-directory={profile_dir}",
+                        "--disable-blink-features=AutomationControlled",
+                        "--no-sandbox",
+                        *self.FAST_LAUNCH_ARGS,
+                    ],
+                )
 
+                # Closed even when navigation fails, so Chromium releases the
+                # profile before the temp dir is removed
+                try:
+                    self._block_assets(context)
                     page = context.new_page()
-                    page.goto(
-                        "https://store.epicgames.com", wait_until="domcontentloaded", timeout=30000
-                    )
-                    page.wait_for_timeout(2000)
+                    eg1_set = self._watch_eg1(context, page)
+                    page.goto("https://store.epicgames.com", wait_until="commit", timeout=30000)
+                    self._wait_for_settle(page, 3000, eg1_set)
 
-                    cookies = context.cookies()
+                    cookies = context.cookies(self.EPIC_URLS)
                     result = self._parse_cookies(cookies)
-
-                    page.close()
+                finally:
                     context.close()
 
-            finally:
-                # Cleanup temp dir
-                with contextlib.suppress(Exception):
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-
         except Exception as e:
             self._log("debug", f"Temp profile method failed: {e}")
 
         return result
 
-    def _extract_with_login_check(self) -> ExtractedCookies:
-        """Launch headless browser and check if logged in."""
+    def _extract_with_login_check(self, p: Any) -> ExtractedCookies:
+        """
+        Launch headless browser and check if logged in.
+
+        Args:
+            p: Running Playwright instance.
+        """
         result = ExtractedCookies()
 
         try:
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
+            browser = p.chromium.launch(headless=True, args=self.FAST_LAUNCH_ARGS)
+            try:
                 context = browser.new_context()
-                page = context.new_page()
-
-                # Go to Epic login page
-                page.goto(
-                    "https://store.epicgames.com", wait_until="domcontentloaded", timeout=30000
-                )
-                page.wait_for_timeout(3000)
+                try:
+                    self._block_assets(context)
+                    page = context.new_page()
+                    eg1_set = self._watch_eg1(context, page)
 
-                cookies = context.cookies()
-                result = self._parse_cookies(cookies)
+                    # Go to Epic login page
+                    page.goto("https://store.epicgames.com", wait_until="commit", timeout=30000)
+                    self._wait_for_settle(page, 3000, eg1_set)
 
+                    cookies = context.cookies(self.EPIC_URLS)
+                    result = self._parse_cookies(cookies)
+                finally:
+                    context.close()
+            finally:
                 browser.close()
 
         except Exception as e:
@@ -271,39 +377,102 @@ class PlaywrightCookieExtractor:
 
         return result
 
+    def _block_assets(self, context: Any) -> None:
+        """Abort requests for BLOCKED_RESOURCE_TYPES in ``context``."""
+        blocked = self.BLOCKED_RESOURCE_TYPES
+
+        def handle(route: Any) -> None:
+            if route.request.resource_type in blocked:
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", handle)
+
+    @staticmethod
+    def _watch_eg1(context: Any, page: Any) -> threading.Event | None:
+        """
+        Watch ``page``'s responses for a ``Set-Cookie: EPIC_EG1``.
+
+        Raw response headers (including Set-Cookie) are only exposed over
+        CDP, so this opens a CDP session on the page.
+
+        Returns:
+            Event set once an EPIC_EG1 token is received, or None if CDP
+            is unavailable.
+        """
+        eg1_set = threading.Event()
+
+        def on_extra_info(params: dict[str, Any]) -> None:
+            for name, value in params.get("headers", {}).items():
+                if name.lower() == "set-cookie" and "EPIC_EG1=eg1~" in value:
+                    eg1_set.set()
+
+        try:
+            client = context.new_cdp_session(page)
+            client.on("Network.responseReceivedExtraInfo", on_extra_info)
+            client.send("Network.enable")
+        except Exception:
+            return None
+        return eg1_set
+
+    @staticmethod
+    def _wait_for_settle(page: Any, timeout_ms: int, done: threading.Event | None = None) -> None:
+        """
+        Wait until the page's network goes idle, at most ``timeout_ms``.
+
+        Cookies are set by the page's requests, so this returns as soon as
+        they finish instead of sleeping a fixed time.
+
+        Args:
+            page: Playwright page.
+            timeout_ms: Maximum wait in milliseconds.
+            done: Optional event (see :meth:`_watch_eg1`) that ends the wait
+                early once set.
+        """
+        _, PlaywrightTimeoutError = _playwright_api()
+
+        if done is None:
+            with contextlib.suppress(PlaywrightTimeoutError):
+                page.wait_for_load_state("networkidle", timeout=timeout_ms)
+            return
+
+        # Short slices: Playwright only dispatches the CDP events to the
+        # listener while one of its calls is running
+        deadline = time.monotonic() + timeout_ms / 1000
+        while not done.is_set() and (remaining := deadline - time.monotonic()) > 0:
+            try:
+                page.wait_for_load_state("networkidle", timeout=min(100, remaining * 1000))
+                return
+            except PlaywrightTimeoutError:
+                pass
+
     def _parse_cookies(self, cookies: list) -> ExtractedCookies:
         """Parse Playwright cookies list into ExtractedCookies."""
         result = ExtractedCookies()
 
         for cookie in cookies:
-            domain = cookie.get("domain", "")
-            name = cookie.get("name", "")
-            value = cookie.get("value", "")
-
-            if not any(d in domain for d in ["epicgames.com"]):
+            # Already limited to Epic's domains by context.cookies(EPIC_URLS);
+            # Playwright cookie dicts always carry name and value
+            name = cookie["name"]
+            attr = COOKIE_FIELDS.get(name)
+            if not attr:
                 continue
-
-            if name == "EPIC_EG1" and value:
-                result.epic_eg1 = value
-                self._log("debug", f"EPIC_EG1 encontrado ({len(value)} chars)")
-            elif name == "EPIC_SSO" and value:
-                result.epic_sso = value
-                self._log("debug", "EPIC_SSO encontrado")
-            elif name == "cf_clearance" and value:
-                result.cf_clearance = value
-                self._log("debug", "CF_CLEARANCE encontrado")
-            elif name == "REFRESH_EPIC_EG1" and value:
-                result.refresh_eg1 = value
-                self._log("debug", f"REFRESH_EPIC_EG1 encontrado ({len(value)} chars)")
-            elif name == "bearerTokenHash" and value:
-                result.bearer_hash = value
-                self._log("debug", "bearerTokenHash encontrado")
+            value = cookie["value"]
+            if value:
+                setattr(result, attr, value)
+                self._log("debug", "%s encontrado (%s chars)", name, len(value))
 
         return result
 
-    def extract_and_validate(self) -> tuple[ExtractedCookies, bool]:
-        """Extract and validate cookies."""
-        cookies = self.extract_cookies_playwright()
+    def extract_and_validate(self, try_direct: bool = True) -> tuple[ExtractedCookies, bool]:
+        """
+        Extract and validate cookies.
+
+        Args:
+            try_direct: See :meth:`extract_cookies_playwright`.
+        """
+        cookies = self.extract_cookies_playwright(try_direct=try_direct)
 
         if cookies.has_eg1():
             self._log("info", "✅ EPIC_EG1 extraído com sucesso")
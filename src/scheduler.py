@@ -9,14 +9,26 @@ Features:
 - Detailed logging of schedule events
 """
 
+import contextlib
+import select
 import signal
+import socket
 import sys
+import threading
 import time
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-from .claimer import EpicGamesClaimer
 from .config import Config
-from .logger import Logger
+from .logger import Logger, get_logger
+
+
+if TYPE_CHECKING:
+    from .session_store import Session, SessionStore
+
+
+# Longest single wait in _wait_for_stop (unbounded except on Windows)
+_MAX_WAIT_SLICE = 60.0 if sys.platform == "win32" else threading.TIMEOUT_MAX
 
 
 class Scheduler:
@@ -24,9 +36,21 @@ class Scheduler:
     Scheduler that runs the claimer at configured times.
 
     Default schedule: Every day at 12:00 (noon).
-    Configure via SCHEDULE_HOUR and SCHEDULE_MINUTE in .env.
+    Configure via SCHEDULE_HOUR and SCHEDULE_MINUTE in .env, or set
+    SCHEDULE_INTERVAL_MINUTES to run every N minutes instead.
     """
 
+    __slots__ = (
+        "_logger",
+        "_running",
+        "_session_store",
+        "_skip_chrome_until",
+        "_stop_event",
+        "_wakeup_sock",
+        "_wakeup_w",
+        "config",
+    )
+
     def __init__(self, config: Config | None = None, logger: Logger | None = None):
         """
         Initialize scheduler.
@@ -36,19 +60,45 @@ class Scheduler:
             logger: Logger instance.
         """
         self.config = config or Config()
-        self._logger = logger or Logger(str(self.config.log_base_dir))
+        self._logger = logger or get_logger(str(self.config.log_base_dir))
         self._running = True
+        self._stop_event = threading.Event()
+        self._session_store: SessionStore | None = None
+        # Monotonic time until which the Chrome pre-refresh is skipped
+        self._skip_chrome_until = 0.0
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self) -> None:
         """Setup graceful shutdown handlers."""
-
-        def handler(signum, frame):
-            self._logger.info("\n⏹️  Scheduler interrompido pelo usuário")
-            self._running = False
-
-        signal.signal(signal.SIGINT, handler)
-        signal.signal(signal.SIGTERM, handler)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+        # Signals also write a byte to this socket pair, which wakes the
+        # select() in _wait_for_stop; unlike a lock wait that works on
+        # Windows too (only possible from the main thread)
+        self._wakeup_sock: socket.socket | None = None
+        self._wakeup_w: socket.socket | None = None
+        try:
+            wakeup_r, wakeup_w = socket.socketpair()
+            wakeup_r.setblocking(False)
+            wakeup_w.setblocking(False)
+            signal.set_wakeup_fd(wakeup_w.fileno())
+        except (ValueError, OSError):
+            return
+        self._wakeup_sock = wakeup_r
+        self._wakeup_w = wakeup_w
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        """Stop the scheduler (SIGINT/SIGTERM handler)."""
+        self._logger.info("\n⏹️  Scheduler interrompido pelo usuário")
+        self._running = False
+        self._stop_event.set()
+        # Wake the select() even if something replaced our wakeup fd: on
+        # POSIX the handler runs inside the interrupted select(), which then
+        # retries and finds this byte
+        if self._wakeup_w is not None:
+            with contextlib.suppress(OSError):
+                self._wakeup_w.send(b"\0")
 
     def get_next_run_time(self) -> datetime:
         """
@@ -90,16 +140,11 @@ class Scheduler:
         Returns:
             Formatted string (e.g., "5h 30min").
         """
-        total_seconds = int(td.total_seconds())
-        hours, remainder = divmod(total_seconds, 3600)
+        hours, remainder = divmod(int(td.total_seconds()), 3600)
         minutes, seconds = divmod(remainder, 60)
-
         if hours > 0:
             return f"{hours}h {minutes}min"
-        elif minutes > 0:
-            return f"{minutes}min {seconds}s"
-        else:
-            return f"{seconds}s"
+        return f"{minutes}min {seconds}s" if minutes > 0 else f"{seconds}s"
 
     def run_once(self) -> None:
         """
@@ -110,6 +155,8 @@ class Scheduler:
         self._logger.header("🎮 EPIC GAMES CLAIMER - EXECUÇÃO ÚNICA")
 
         try:
+            from .claimer import EpicGamesClaimer
+
             claimer = EpicGamesClaimer(self.config, self._logger)
             result = claimer.run()
 
@@ -125,29 +172,51 @@ class Scheduler:
         Executes immediately on start, then waits for next scheduled time.
         """
         self._logger.header("⏰ EPIC GAMES CLAIMER - MODO AGENDADO")
-        self._logger.info(
-            f"Horário configurado: {self.config.schedule_hour:02d}:{self.config.schedule_minute:02d}"
-        )
+        interval = self.config.schedule_interval_minutes * 60
+        if interval > 0:
+            self._logger.info(
+                f"Intervalo configurado: {self.format_duration(timedelta(seconds=interval))}"
+            )
+        else:
+            self._logger.info(
+                f"Horário configurado: "
+                f"{self.config.schedule_hour:02d}:{self.config.schedule_minute:02d}"
+            )
         self._logger.info("Pressione Ctrl+C para parar\n")
 
         # Run immediately on start
         self._logger.info("Executando verificação inicial...")
+        started = time.monotonic()
         self._execute_claim()
 
         # Then run on schedule
         while self._running:
-            next_run = self.get_next_run_time()
-            wait_time = self.time_until_next_run()
+            if interval > 0:
+                # Monotonic deadline measured from the start of the last run,
+                # so neither its duration nor a wall-clock step moves it; the
+                # datetime is only for the log line
+                deadline = started + interval
+                next_run = datetime.now() + timedelta(seconds=max(0.0, deadline - time.monotonic()))
+            else:
+                next_run = self.get_next_run_time()
+            wait_time = next_run - datetime.now()
 
             self._logger.info(
                 f"Próxima execução: {next_run.strftime('%Y-%m-%d %H:%M:%S')} "
                 f"(em {self.format_duration(wait_time)})"
             )
 
+            # Don't hold this run's buffered log lines through the wait
+            self._logger.flush()
+
             # Wait until next run time (checking periodically for shutdown)
-            self._wait_until(next_run)
+            if interval > 0:
+                self._wait_for_deadline(deadline)
+            else:
+                self._wait_until(next_run)
 
             if self._running:
+                started = time.monotonic()
                 self._execute_claim()
 
         self._logger.info("Scheduler encerrado")
@@ -155,12 +224,14 @@ class Scheduler:
     def _execute_claim(self) -> None:
         """Execute the claim process with error handling."""
         self._logger.info(f"\n{'─' * 50}")
-        self._logger.info(f"Iniciando verificação: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._logger.info("Iniciando verificação: %s", time.strftime("%Y-%m-%d %H:%M:%S"))
 
         # Pre-step: Try to refresh session from Chrome cookies
         self._refresh_session_from_chrome()
 
         try:
+            from .claimer import EpicGamesClaimer
+
             claimer = EpicGamesClaimer(self.config, self._logger)
             result = claimer.run()
 
@@ -181,18 +252,24 @@ class Scheduler:
         This ensures we have the freshest tokens before each scheduled run,
         reducing the chance of token expiration during operation.
         """
+        if time.monotonic() < self._skip_chrome_until:
+            self._logger.debug("Sessão verificada recentemente, pulando refresh do Chrome")
+            return
+
         try:
-            from .session_store import SessionStore
+            if self._session_store is None:
+                from .session_store import SessionStore
 
-            session_store = SessionStore(self.config.session_file, self._logger)
+                # Kept across runs: it remembers what it last wrote, so an
+                # unchanged session isn't saved again
+                self._session_store = SessionStore(self.config.session_file, self._logger)
+            session_store = self._session_store
 
             # Check if current session is still valid
             current_session = session_store.load()
-            if current_session and current_session.is_valid():
-                remaining = current_session.time_until_expiry()
-                if remaining and remaining.total_seconds() > 3600:  # More than 1 hour left
-                    self._logger.debug("Sessão ainda válida, pulando refresh do Chrome")
-                    return
+            if current_session and self._hold_session(current_session):
+                self._logger.debug("Sessão ainda válida, pulando refresh do Chrome")
+                return
 
             # Try to refresh from Chrome
             self._logger.info("Tentando atualizar sessão do Chrome...")
@@ -200,30 +277,104 @@ class Scheduler:
 
             if new_session:
                 self._logger.info("✅ Sessão atualizada do Chrome antes da execução")
+                self._hold_session(new_session)
             else:
                 self._logger.debug("Não foi possível atualizar do Chrome, usando sessão existente")
 
         except Exception as e:
-            self._logger.debug(f"Refresh Chrome falhou: {e}")
+            self._logger.debug("Refresh Chrome falhou: %s", e)
+
+    def _hold_session(self, session: "Session") -> bool:
+        """
+        Skip the Chrome pre-refresh for a while if ``session`` stays valid.
+
+        The skip lasts until an hour before the token expires, capped at
+        an hour, so short schedule intervals don't re-read the session
+        file (or Chrome) every run.
+
+        Args:
+            session: Session just loaded or refreshed.
+
+        Returns:
+            True if the session has more than an hour left.
+        """
+        remaining = session.time_until_expiry() if session.is_valid() else None
+        if not remaining or remaining.total_seconds() <= 3600:  # Less than 1 hour left
+            return False
+        self._skip_chrome_until = time.monotonic() + min(3600, remaining.total_seconds() - 3600)
+        return True
 
     def _wait_until(self, target: datetime) -> None:
         """
-        Wait until target time, checking periodically for shutdown.
+        Wait until target time or shutdown, whichever comes first.
 
         Args:
             target: Target datetime to wait for.
         """
-        while self._running and datetime.now() < target:
-            # Sleep in intervals to allow for graceful shutdown
-            remaining = (target - datetime.now()).total_seconds()
-            base_min = 5 if getattr(self.config, "low_cpu_mode", False) else 1
-            sleep_time = min(60, max(base_min, remaining))
-            time.sleep(sleep_time)
+        # Count down on the monotonic clock, so wall-clock steps (NTP) don't
+        # stretch or cut the wait; the wall clock is read again once the
+        # deadline passes, in case it moved meanwhile
+        while self._running and (remaining := (target - datetime.now()).total_seconds()) > 0:
+            if self._wait_for_deadline(time.monotonic() + remaining):
+                return
+
+    def _wait_for_deadline(self, deadline: float) -> bool:
+        """
+        Wait until a ``time.monotonic()`` deadline or shutdown.
+
+        Args:
+            deadline: Monotonic time to wait for.
+
+        Returns:
+            True if the wait ended because the scheduler is stopping.
+        """
+        while self._running and (left := deadline - time.monotonic()) > 0:
+            if self._wait_for_stop(left):
+                return True
+        return not self._running
+
+    def _wait_for_stop(self, timeout: float) -> bool:
+        """
+        Block until a shutdown signal arrives or ``timeout`` seconds pass.
+
+        Args:
+            timeout: Maximum wait in seconds.
+
+        Returns:
+            True if the scheduler is stopping.
+        """
+        if self._wakeup_sock is None:
+            # The signal handler sets the event, which ends the wait at once;
+            # only Windows needs slices, as Ctrl+C can't interrupt a lock
+            # wait there and the handler runs between slices
+            return self._stop_event.wait(min(timeout, _MAX_WAIT_SLICE))
+
+        # Re-install the wakeup fd before every wait: other event loops on
+        # the main thread (Playwright's asyncio loop on Windows) install
+        # their own and reset it to -1 when they close. Waits are still
+        # sliced in case it gets replaced while we wait.
+        with contextlib.suppress(ValueError, OSError):
+            signal.set_wakeup_fd(self._wakeup_w.fileno())
+
+        if select.select([self._wakeup_sock], [], [], min(timeout, _MAX_WAIT_SLICE))[0]:
+            with contextlib.suppress(OSError):
+                self._wakeup_sock.recv(64)
+        # The Python-level handler may only run once the caller loops, which
+        # re-checks self._running
+        return self._stop_event.is_set()
 
     def check_schedule_status(self) -> None:
         """Log current schedule status."""
+        interval = self.config.schedule_interval_minutes
+        if interval > 0:
+            self._logger.subheader("STATUS DO AGENDAMENTO")
+            self._logger.info(
+                f"Intervalo agendado: {self.format_duration(timedelta(minutes=interval))}"
+            )
+            return
+
         next_run = self.get_next_run_time()
-        wait_time = self.time_until_next_run()
+        wait_time = next_run - datetime.now()
 
         self._logger.subheader("STATUS DO AGENDAMENTO")
         self._logger.info(
@@ -3,26 +3,77 @@ Session management for Epic Games Claimer.
 
 Handles:
 - Authentication token storage
-- Session persistence to JSON
+- Session persistence to JSON (atomic, skipped when unchanged)
 - Token validation and expiration checks
 - Conversion from legacy formats
 """
 
 import base64
+import contextlib
 import json
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .logger import Logger
+from .utils import atomic_write_bytes, ensure_dir, json_dumps, json_loads, parse_datetime
 
 
 if TYPE_CHECKING:
     from .config import Config
 
 
-@dataclass
+def decode_eg1_claims(token: str) -> dict[str, Any] | None:
+    """
+    Decode the JWT payload of an Epic access token locally.
+
+    The signature is not checked; this only reads claims such as ``sub``
+    (account id), ``dn`` (display name) and ``exp`` without a network
+    round trip.
+
+    Args:
+        token: Access token, with or without the ``eg1~`` prefix.
+
+    Returns:
+        Claims dictionary, or None if the token isn't a decodable JWT.
+    """
+    if token.startswith("eg1~"):
+        token = token[4:]
+
+    try:
+        # Tokens are ASCII: split as bytes, which b64decode takes directly
+        parts = token.encode("ascii").split(b".", 2)
+        if len(parts) < 2:
+            return None
+
+        # Decode JWT payload (add padding if needed)
+        payload = parts[1] + b"=" * (-len(parts[1]) % 4)
+        claims = json_loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def _aware_timestamp(value: datetime | None) -> float | None:
+    """POSIX timestamp of a timezone-aware datetime (None for naive or missing)."""
+    if value is None or value.tzinfo is None:
+        return None
+    return value.timestamp()
+
+
+def _parse_iso(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp (``Z`` suffix allowed), or None if invalid."""
+    if not value:
+        return None
+    try:
+        return parse_datetime(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(slots=True, kw_only=True)
 class Session:
     """Stores authentication tokens and account information."""
 
@@ -34,6 +85,57 @@ class Session:
     refresh_expires_at: str = ""  # ISO format timestamp
     cookies: dict[str, str] = field(default_factory=dict)
 
+    # Parsed expiry times, cached until the strings change (not persisted);
+    # the *_ts POSIX timestamps are None unless the time has a UTC offset
+    _expires_src: str = field(default="", init=False, repr=False, compare=False)
+    _expires_dt: datetime | None = field(default=None, init=False, repr=False, compare=False)
+    _expires_ts: float | None = field(default=None, init=False, repr=False, compare=False)
+    _refresh_src: str = field(default="", init=False, repr=False, compare=False)
+    _refresh_dt: datetime | None = field(default=None, init=False, repr=False, compare=False)
+    _refresh_ts: float | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _sync_expiry(self) -> None:
+        """Re-parse ``expires_at`` if the string changed since the last parse."""
+        if self._expires_src != self.expires_at:
+            self._expires_src = self.expires_at
+            self._expires_dt = _parse_iso(self.expires_at)
+            self._expires_ts = _aware_timestamp(self._expires_dt)
+
+    def _sync_refresh_expiry(self) -> None:
+        """Re-parse ``refresh_expires_at`` if the string changed since the last parse."""
+        if self._refresh_src != self.refresh_expires_at:
+            self._refresh_src = self.refresh_expires_at
+            self._refresh_dt = _parse_iso(self.refresh_expires_at)
+            self._refresh_ts = _aware_timestamp(self._refresh_dt)
+
+    @property
+    def expires_at_dt(self) -> datetime | None:
+        """``expires_at`` as a datetime, parsed only when the string changed."""
+        self._sync_expiry()
+        return self._expires_dt
+
+    @property
+    def refresh_expires_at_dt(self) -> datetime | None:
+        """``refresh_expires_at`` as a datetime, parsed only when the string changed."""
+        self._sync_refresh_expiry()
+        return self._refresh_dt
+
+    def set_expiry(self, expires_at: datetime, refresh_expires_at: datetime | None = None) -> None:
+        """
+        Set expiry times from datetimes, priming the parsed caches.
+
+        Args:
+            expires_at: Access token expiry (timezone-aware).
+            refresh_expires_at: Refresh token expiry, if known.
+        """
+        self.expires_at = self._expires_src = expires_at.isoformat()
+        self._expires_dt = expires_at
+        self._expires_ts = _aware_timestamp(expires_at)
+        if refresh_expires_at is not None:
+            self.refresh_expires_at = self._refresh_src = refresh_expires_at.isoformat()
+            self._refresh_dt = refresh_expires_at
+            self._refresh_ts = _aware_timestamp(refresh_expires_at)
+
     def is_valid(self) -> bool:
         """
         Check if access token is still valid.
@@ -41,14 +143,11 @@ class Session:
         Returns:
             True if token exists and hasn't expired (with 5-min buffer).
         """
-        if not self.access_token or not self.expires_at:
-            return False
-        try:
-            expires = datetime.fromisoformat(self.expires_at.replace("Z", "+00:00"))
-            # 5-minute buffer before expiration
-            return datetime.now(timezone.utc) < (expires - timedelta(minutes=5))
-        except (ValueError, TypeError):
+        if not self.access_token:
             return False
+        self._sync_expiry()
+        # 5-minute buffer before expiration
+        return self._expires_ts is not None and time.time() < self._expires_ts - 300
 
     def can_refresh(self) -> bool:
         """
@@ -57,28 +156,21 @@ class Session:
         Returns:
             True if refresh token exists and hasn't expired.
         """
-        if not self.refresh_token or not self.refresh_expires_at:
-            return False
-        try:
-            expires = datetime.fromisoformat(self.refresh_expires_at.replace("Z", "+00:00"))
-            return datetime.now(timezone.utc) < expires
-        except (ValueError, TypeError):
+        if not self.refresh_token:
             return False
+        self._sync_refresh_expiry()
+        return self._refresh_ts is not None and time.time() < self._refresh_ts
 
     def time_until_expiry(self) -> timedelta | None:
         """Get time remaining until token expires."""
-        if not self.expires_at:
-            return None
-        try:
-            expires = datetime.fromisoformat(self.expires_at.replace("Z", "+00:00"))
-            remaining = expires - datetime.now(timezone.utc)
-            return remaining if remaining.total_seconds() > 0 else timedelta(0)
-        except (ValueError, TypeError):
+        self._sync_expiry()
+        if self._expires_ts is None:
             return None
+        return timedelta(seconds=max(0.0, self._expires_ts - time.time()))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert session to dictionary for JSON serialization."""
-        return asdict(self)
+        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Session":
@@ -118,18 +210,10 @@ class Session:
             return None
 
         try:
-            jwt_part = eg1_token[4:]  # Remove 'eg1~' prefix
-            parts = jwt_part.split(".")
-
-            if len(parts) < 2:
+            payload_data = decode_eg1_claims(eg1_token)
+            if payload_data is None:
                 return None
 
-            # Decode JWT payload (add padding if needed)
-            payload = parts[1]
-            payload += "=" * (4 - len(payload) % 4)
-            decoded = base64.urlsafe_b64decode(payload)
-            payload_data = json.loads(decoded)
-
             # Extract fields from JWT
             account_id = payload_data.get("sub", "")
             display_name = payload_data.get("dn", "")
@@ -164,6 +248,8 @@ class SessionStore:
         """
         self.session_file = session_file
         self._logger = logger
+        # Contents of session_file as last read/written, to skip redundant saves
+        self._persisted: dict[str, Any] | None = None
 
     def load(self) -> Session | None:
         """
@@ -177,8 +263,7 @@ class SessionStore:
                 self._logger.debug("No saved session found", path=str(self.session_file))
                 return None
 
-            with open(self.session_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(self.session_file.read_bytes())
 
             # Handle legacy Playwright cookie format
             if "cookies" in data and isinstance(data["cookies"], list):
@@ -186,10 +271,12 @@ class SessionStore:
                 self._logger.debug("Converted legacy session format")
             else:
                 session = Session.from_dict(data)
+                self._persisted = session.to_dict()
 
             if session.display_name:
                 self._logger.info(
-                    f"Session loaded for: {session.display_name}",
+                    "Session loaded for: %s",
+                    session.display_name,
                     account_id=session.account_id[:8] + "..." if session.account_id else None,
                 )
 
@@ -197,7 +284,7 @@ class SessionStore:
                 remaining = session.time_until_expiry()
                 if remaining:
                     hours = remaining.total_seconds() / 3600
-                    self._logger.debug(f"Token expires in {hours:.1f} hours")
+                    self._logger.debug("Token expires in %.1f hours", hours)
 
             return session
 
@@ -218,17 +305,11 @@ class SessionStore:
         Returns:
             Session instance.
         """
-        cookies_dict = {}
-        eg1_token = ""
-
         # Extract cookies from array format
-        for cookie in data.get("cookies", []):
-            name = cookie.get("name", "")
-            value = cookie.get("value", "")
-            cookies_dict[name] = value
-
-            if name == "EPIC_EG1":
-                eg1_token = value
+        cookies_dict = {
+            cookie.get("name", ""): cookie.get("value", "") for cookie in data.get("cookies", [])
+        }
+        eg1_token = cookies_dict.get("EPIC_EG1", "")
 
         # Try to create session from EG1 token
         if eg1_token:
@@ -244,6 +325,11 @@ class SessionStore:
         """
         Save session to file.
 
+        Skipped when the session is unchanged since the last load/save (or,
+        before either, when the file already holds the same bytes), so
+        repeated saves after verify/refresh cost nothing. The file is
+        replaced atomically.
+
         Args:
             session: Session instance to save.
 
@@ -251,10 +337,22 @@ class SessionStore:
             True if saved successfully.
         """
         try:
-            self.session_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.session_file, "w", encoding="utf-8") as f:
-                json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+            data = session.to_dict()
+            if data == self._persisted and self.session_file.exists():
+                return True
+
+            payload = json_dumps(data, indent=True)
+            if self._persisted is None:
+                # Nothing loaded/saved by this store yet: the file on disk
+                # (e.g. written by another process) may already match
+                with contextlib.suppress(OSError):
+                    if self.session_file.read_bytes() == payload:
+                        self._persisted = data
+                        return True
+
+            ensure_dir(self.session_file.parent)
+            atomic_write_bytes(self.session_file, payload, fsync=True)
+            self._persisted = data
 
             self._logger.debug(
                 "Session saved", path=str(self.session_file), account=session.display_name
@@ -276,6 +374,7 @@ class SessionStore:
             if self.session_file.exists():
                 self.session_file.unlink()
                 self._logger.info("Session cleared", path=str(self.session_file))
+            self._persisted = None
             return True
         except Exception as e:
             self._logger.error("Error clearing session", exc=e)
@@ -324,8 +423,6 @@ class SessionStore:
                     },
                 )
                 # Set refresh_expires_at to far future so can_refresh() returns True
-                from datetime import datetime, timedelta, timezone
-
                 session.refresh_expires_at = (
                     datetime.now(timezone.utc) + timedelta(days=30)
                 ).isoformat()
@@ -360,7 +457,7 @@ class SessionStore:
             self._logger.error(
                 "Dependências não instaladas para extração Chrome",
                 exc=e,
-                hint="pip install pywin32 cryptography",
+                hint="pip install cryptography",
             )
             return None
         except Exception as e:
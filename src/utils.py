@@ -0,0 +1,184 @@
+"""
+Shared helpers for Epic Games Claimer.
+
+Contains:
+- JSON (de)serialization, using orjson when installed
+- Atomic file writes
+- Directory creation with a per-process cache
+- Token-bucket rate limiting
+- ISO 8601 parsing, using ciso8601 when installed
+"""
+
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime  # type: ignore
+except ImportError:
+    _ciso_parse_datetime = None  # type: ignore
+
+
+def json_dumps(data: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-serializable object.
+        indent: Pretty-print with 2-space indentation.
+
+    Returns:
+        Encoded JSON (non-ASCII characters kept as UTF-8).
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        Parsed object.
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp (a trailing ``Z`` is accepted).
+
+    Args:
+        value: Timestamp string.
+
+    Returns:
+        Parsed datetime (timezone-aware if the string has an offset).
+
+    Raises:
+        ValueError: If the string is not a valid timestamp.
+    """
+    if _ciso_parse_datetime:
+        return _ciso_parse_datetime(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, fsync: bool = False) -> None:
+    """
+    Write a file atomically.
+
+    Data goes to a uniquely named sibling ``.tmp`` file that then replaces
+    ``path``, so readers never see a partially written file and concurrent
+    writers never share a temp file.
+
+    Args:
+        path: Destination file.
+        data: File contents.
+        fsync: Flush the data to disk before the rename, so a crash or
+            power loss can't leave an empty file behind.
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except FileNotFoundError:
+        # The directory was removed after ensure_dir() cached it
+        forget_dir(path.parent)
+        raise
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Directories created or seen by ensure_dir() in this process
+_known_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory (and parents) unless it already exists.
+
+    Directories are remembered per process, so repeated calls for the same
+    path don't touch the filesystem again.
+
+    Args:
+        path: Directory to create.
+
+    Returns:
+        The same path.
+    """
+    if path not in _known_dirs:
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(path)
+    return path
+
+
+def forget_dir(path: Path) -> None:
+    """
+    Drop ``path`` (and its subdirectories) from the ensure_dir() cache.
+
+    Call when a write finds the directory gone, so the next ensure_dir()
+    creates it again.
+
+    Args:
+        path: Directory that no longer exists.
+    """
+    for known in [d for d in _known_dirs if d == path or path in d.parents]:
+        _known_dirs.discard(known)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+
+    Allows bursts of up to ``burst`` calls, refilling at ``rate`` tokens per
+    second; :meth:`acquire` only sleeps once the burst is used up.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            self._updated += wait
+            self._tokens = 1.0
+        self._tokens -= 1
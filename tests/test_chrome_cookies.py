@@ -0,0 +1,69 @@
+"""Tests for AES-GCM cookie decryption."""
+
+import os
+import sys
+import types
+
+import pytest
+
+from src.chrome_cookies import ChromeCookieExtractor, _gcm_decryptor
+
+
+AESGCM = pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead").AESGCM
+
+
+@pytest.fixture(autouse=True)
+def _fresh_decryptors():
+    """Don't let a decryptor built under one set of imports leak into another test."""
+    _gcm_decryptor.cache_clear()
+    yield
+    _gcm_decryptor.cache_clear()
+
+
+@pytest.fixture
+def key() -> bytes:
+    return os.urandom(32)
+
+
+@pytest.fixture
+def extractor(key, monkeypatch) -> ChromeCookieExtractor:
+    extractor = ChromeCookieExtractor(profile_name="Default")
+    monkeypatch.setattr(extractor, "get_encryption_key", lambda: key)
+    return extractor
+
+
+def _encrypt(key: bytes, plaintext: bytes, prefix: bytes = b"v10") -> bytes:
+    nonce = os.urandom(12)
+    return prefix + nonce + AESGCM(key).encrypt(nonce, plaintext, None)
+
+
+@pytest.mark.parametrize("prefix", [b"v10", b"v11", b"v20"])
+def test_decrypts_gcm_cookie(extractor, key, prefix):
+    assert extractor.decrypt_cookie_value(_encrypt(key, b"eg1~token", prefix)) == "eg1~token"
+
+
+def test_tampered_cookie_decrypts_to_empty(extractor, key):
+    blob = bytearray(_encrypt(key, b"eg1~token"))
+    blob[-1] ^= 1
+
+    assert extractor.decrypt_cookie_value(bytes(blob)) == ""
+
+
+def test_legacy_pycrypto_without_gcm_falls_back(extractor, key, monkeypatch):
+    # PyCrypto also installs Crypto.Cipher.AES, but without MODE_GCM
+    legacy_aes = types.SimpleNamespace(MODE_CBC=2)
+    monkeypatch.setitem(sys.modules, "Cryptodome", None)
+    monkeypatch.setitem(sys.modules, "Cryptodome.Cipher", None)
+    monkeypatch.setitem(sys.modules, "Crypto", types.ModuleType("Crypto"))
+    monkeypatch.setitem(sys.modules, "Crypto.Cipher", types.SimpleNamespace(AES=legacy_aes))
+
+    assert extractor.decrypt_cookie_value(_encrypt(key, b"eg1~token")) == "eg1~token"
+
+
+def test_pycryptodome_backend_is_preferred(extractor, key):
+    aes = pytest.importorskip("Crypto.Cipher.AES")
+    if not hasattr(aes, "MODE_GCM"):
+        pytest.skip("legacy PyCrypto installed")
+
+    assert extractor.decrypt_cookie_value(_encrypt(key, b"eg1~token")) == "eg1~token"
+    assert _gcm_decryptor(key).__name__ == "decrypt"
@@ -0,0 +1,108 @@
+"""Tests for the claimer's claim batch and persisted owned-games cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.claimer import EpicGamesClaimer
+from src.config import Config
+from src.logger import Logger
+from src.models import ClaimStatus
+from src.session_store import Session
+from src.utils import json_dumps, json_loads
+
+
+ACCOUNT = "account-1"
+
+
+@pytest.fixture
+def claimer(tmp_path, monkeypatch):
+    """Claimer whose data, session and log files live under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    config = Config(
+        session_file=tmp_path / "data" / "session.json",
+        data_dir=tmp_path / "data",
+        log_base_dir=tmp_path / "logs",
+        debug_dir=tmp_path / "logs" / "debug",
+    )
+    config.owned_cache_ttl_minutes = 60
+    with EpicGamesClaimer(config, Logger(str(tmp_path / "logs"), "test-claimer")) as claimer:
+        yield claimer
+
+
+def test_claim_batch_reads_refreshed_token(claimer, monkeypatch):
+    claimer.session = Session(access_token="token-1", account_id=ACCOUNT)
+    games = [{"id": "offer-1", "namespace": "ns-1", "title": "Game"}]
+    tokens_seen = []
+
+    def claim_games_batch(access_token, account_id, claimable, pace=None):
+        # A background refresh replaces the token mid-batch
+        claimer.session.access_token = "token-2"
+        tokens_seen.append(access_token())
+        return {"offer-1": ClaimStatus.CLAIMED}
+
+    monkeypatch.setattr(claimer, "get_claimable_games", lambda: games)
+    monkeypatch.setattr(claimer.api, "claim_games_batch", claim_games_batch)
+
+    result = claimer.claim_all_games()
+
+    assert result.claimed == 1
+    assert tokens_seen == ["token-2"]
+
+
+def _write_cache(claimer: EpicGamesClaimer, namespaces: list[str], age: timedelta) -> None:
+    fetched_at = datetime.now(timezone.utc) - age
+    claimer._owned_cache_file.write_bytes(
+        json_dumps(
+            {ACCOUNT: {"owned_namespaces": namespaces, "fetched_at": fetched_at.isoformat()}}
+        )
+    )
+
+
+def test_fresh_owned_cache_is_used(claimer):
+    _write_cache(claimer, ["ns-a", "ns-b"], timedelta(minutes=5))
+
+    assert claimer._load_owned_namespaces(ACCOUNT) == frozenset({"ns-a", "ns-b"})
+
+
+def test_expired_owned_cache_is_ignored(claimer):
+    _write_cache(claimer, ["ns-a"], timedelta(minutes=61))
+
+    assert claimer._load_owned_namespaces(ACCOUNT) is None
+
+
+def test_owned_cache_ttl_zero_disables_it(claimer):
+    claimer.config.owned_cache_ttl_minutes = 0
+    _write_cache(claimer, ["ns-a"], timedelta(seconds=1))
+
+    assert claimer._load_owned_namespaces(ACCOUNT) is None
+
+
+def test_owned_cache_of_other_account_is_ignored(claimer):
+    _write_cache(claimer, ["ns-a"], timedelta(minutes=5))
+
+    assert claimer._load_owned_namespaces("account-2") is None
+
+
+def test_claimed_and_already_owned_games_are_merged_into_cache(claimer, monkeypatch):
+    _write_cache(claimer, ["ns-old"], timedelta(minutes=5))
+    claimer.session = Session(access_token="token-1", account_id=ACCOUNT)
+    games = [
+        {"id": "offer-1", "namespace": "ns-claimed", "title": "Claimed"},
+        {"id": "offer-2", "namespace": "ns-owned", "title": "Owned"},
+        {"id": "offer-3", "namespace": "ns-failed", "title": "Failed"},
+    ]
+    statuses = {
+        "offer-1": ClaimStatus.CLAIMED,
+        "offer-2": ClaimStatus.ALREADY_OWNED,
+        "offer-3": ClaimStatus.FAILED,
+    }
+
+    monkeypatch.setattr(claimer, "get_claimable_games", lambda: games)
+    monkeypatch.setattr(claimer.api, "claim_games_batch", lambda *args, **kwargs: statuses)
+
+    result = claimer.claim_all_games()
+
+    assert (result.claimed, result.already_owned, result.failed) == (1, 1, 1)
+    entry = json_loads(claimer._owned_cache_file.read_bytes())[ACCOUNT]
+    assert entry["owned_namespaces"] == ["ns-claimed", "ns-old", "ns-owned"]
@@ -0,0 +1,42 @@
+"""Tests for the date-based log file handler."""
+
+import logging
+import shutil
+
+from src.logger import LazyDateFileHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_unwritable_log_dir_does_not_raise(tmp_path, monkeypatch):
+    # A file where the log directory should be: every open fails
+    base_dir = tmp_path / "logs"
+    base_dir.write_text("not a directory")
+    handler = LazyDateFileHandler(base_dir)
+    errors: list[logging.LogRecord] = []
+    monkeypatch.setattr(handler, "handleError", errors.append)
+
+    handler.emit(_record("first"))
+    handler.emit(_record("second"))
+    handler.close()
+
+    # Reported once, then file logging is skipped instead of retried
+    assert len(errors) == 1
+
+
+def test_log_dir_removed_while_running_is_recreated(tmp_path):
+    base_dir = tmp_path / "logs"
+    handler = LazyDateFileHandler(base_dir)
+    handler.emit(_record("first"))
+    handler.close()
+
+    shutil.rmtree(base_dir)
+
+    handler = LazyDateFileHandler(base_dir)
+    handler.emit(_record("second"))
+    handler.close()
+
+    (log_file,) = base_dir.rglob("*.txt")
+    assert "second" in log_file.read_text(encoding="utf-8")
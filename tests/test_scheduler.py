@@ -0,0 +1,118 @@
+"""Tests for the scheduler's waiting logic."""
+
+import os
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from src.config import Config
+from src.logger import Logger
+from src.scheduler import Scheduler
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch) -> Config:
+    """Config whose directories all live under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SCHEDULE_INTERVAL_MINUTES", raising=False)
+    return Config(
+        session_file=tmp_path / "data" / "session.json",
+        data_dir=tmp_path / "data",
+        log_base_dir=tmp_path / "logs",
+        debug_dir=tmp_path / "logs" / "debug",
+    )
+
+
+@pytest.fixture
+def scheduler(config, tmp_path):
+    """Scheduler with its signal handlers and wakeup fd restored afterwards."""
+    old_int = signal.getsignal(signal.SIGINT)
+    old_term = signal.getsignal(signal.SIGTERM)
+    old_fd = signal.set_wakeup_fd(-1)
+    signal.set_wakeup_fd(old_fd)
+
+    sched = Scheduler(config, Logger(str(tmp_path / "logs"), "test-scheduler"))
+    yield sched
+
+    signal.signal(signal.SIGINT, old_int)
+    signal.signal(signal.SIGTERM, old_term)
+    signal.set_wakeup_fd(old_fd)
+    for sock in (sched._wakeup_sock, sched._wakeup_w):
+        if sock is not None:
+            sock.close()
+
+
+def test_negative_interval_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SCHEDULE_INTERVAL_MINUTES", "-5")
+
+    with pytest.raises(ValueError, match="SCHEDULE_INTERVAL_MINUTES"):
+        Config()
+
+
+def test_interval_deadline_counts_from_run_start(scheduler, monkeypatch):
+    scheduler.config.schedule_interval_minutes = 10
+    starts: list[float] = []
+    deadlines: list[float] = []
+
+    def slow_claim(self):
+        starts.append(time.monotonic())
+        time.sleep(0.05)
+
+    def record_deadline(self, deadline):
+        deadlines.append(deadline)
+        if len(deadlines) == 2:
+            self._running = False
+        return not self._running
+
+    monkeypatch.setattr(Scheduler, "_execute_claim", slow_claim)
+    monkeypatch.setattr(Scheduler, "_wait_for_deadline", record_deadline)
+
+    scheduler.run_scheduled()
+
+    # The run's own duration doesn't push the next deadline back
+    assert len(starts) == 2
+    assert deadlines == [
+        pytest.approx(starts[0] + 600, abs=0.02),
+        pytest.approx(starts[1] + 600, abs=0.02),
+    ]
+
+
+def test_wait_for_deadline_returns_when_reached(scheduler):
+    start = time.monotonic()
+
+    assert scheduler._wait_for_deadline(start + 0.1) is False
+    assert time.monotonic() - start >= 0.1
+
+
+def _send_sigterm_after(delay: float) -> threading.Timer:
+    """Deliver SIGTERM to this process from another thread after ``delay``."""
+    timer = threading.Timer(delay, os.kill, args=(os.getpid(), signal.SIGTERM))
+    timer.start()
+    return timer
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal delivery")
+def test_signal_ends_the_wait(scheduler):
+    timer = _send_sigterm_after(0.2)
+    start = time.monotonic()
+
+    assert scheduler._wait_for_deadline(start + 30) is True
+    assert time.monotonic() - start < 5
+    assert scheduler._running is False
+    timer.join()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal delivery")
+def test_signal_ends_the_wait_after_wakeup_fd_reset(scheduler):
+    # Another event loop (e.g. Playwright's) closing resets the wakeup fd
+    signal.set_wakeup_fd(-1)
+    timer = _send_sigterm_after(0.2)
+    start = time.monotonic()
+
+    assert scheduler._wait_for_deadline(start + 30) is True
+    assert time.monotonic() - start < 5
+    timer.join()
@@ -0,0 +1,51 @@
+"""Tests for local decoding of Epic access tokens."""
+
+import base64
+import json
+
+import pytest
+
+from src.session_store import decode_eg1_claims
+
+
+def _jwt(claims: dict) -> str:
+    """Build an unsigned JWT whose payload segment has no base64 padding."""
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJub25lIn0.{payload.decode()}.signature"
+
+
+def _claims_with_payload_length(remainder: int) -> dict:
+    """Claims whose unpadded base64url payload length is ``remainder`` mod 4."""
+    for size in range(40):
+        claims = {"sub": "abc123", "exp": 1_900_000_000, "dn": "x" * size}
+        if len(_jwt(claims).split(".")[1]) % 4 == remainder:
+            return claims
+    raise AssertionError(f"no payload with length % 4 == {remainder}")
+
+
+@pytest.mark.parametrize("remainder", [0, 2, 3])
+def test_decodes_payload_of_any_padding_length(remainder):
+    claims = _claims_with_payload_length(remainder)
+
+    assert decode_eg1_claims(_jwt(claims)) == claims
+
+
+def test_strips_eg1_prefix():
+    claims = {"sub": "abc123", "exp": 1_900_000_000}
+
+    assert decode_eg1_claims("eg1~" + _jwt(claims)) == claims
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "not-a-jwt",
+        "header.%%%.signature",
+        "header.é.signature",
+        # Valid base64 and JSON, but not an object
+        "header." + base64.urlsafe_b64encode(b"[1, 2]").decode().rstrip("=") + ".sig",
+    ],
+)
+def test_undecodable_tokens_return_none(token):
+    assert decode_eg1_claims(token) is None
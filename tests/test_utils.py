@@ -0,0 +1,66 @@
+"""Tests for the file helpers in src.utils."""
+
+import shutil
+import threading
+
+import pytest
+
+from src.utils import atomic_write_bytes, ensure_dir
+
+
+def test_atomic_write_replaces_contents(tmp_path):
+    target = tmp_path / "session.json"
+    target.write_bytes(b"old")
+
+    atomic_write_bytes(target, b"new", fsync=True)
+
+    assert target.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_concurrent_atomic_writes_never_mix(tmp_path):
+    target = tmp_path / "owned_cache.json"
+    payloads = [bytes([65 + i]) * 200_000 for i in range(8)]
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(len(payloads))
+
+    def write(payload: bytes) -> None:
+        barrier.wait()
+        try:
+            for _ in range(5):
+                atomic_write_bytes(target, payload)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    # The last rename wins whole; no temp files are left behind
+    assert target.read_bytes() in payloads
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_failed_atomic_write_leaves_no_temp_file(tmp_path):
+    target = tmp_path / "session.json"
+
+    with pytest.raises(TypeError):
+        atomic_write_bytes(target, "not bytes")  # type: ignore[arg-type]
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_ensure_dir_recreates_a_removed_directory(tmp_path):
+    data_dir = ensure_dir(tmp_path / "data" / "nested")
+    shutil.rmtree(tmp_path / "data")
+
+    # The first write finds the cached directory gone...
+    with pytest.raises(FileNotFoundError):
+        atomic_write_bytes(data_dir / "file.bin", b"x")
+
+    # ...after which ensure_dir creates it again
+    atomic_write_bytes(ensure_dir(data_dir) / "file.bin", b"x")
+    assert (data_dir / "file.bin").read_bytes() == b"x"